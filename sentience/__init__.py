@@ -11,7 +11,7 @@ from ._extension_loader import (
     verify_extension_version,
     verify_extension_version_async,
 )
-from .actions import click, click_rect, press, scroll_to, type_text
+from .actions import click, click_rect, press, run_plan, scroll_to, type_at, type_text
 from .agent import SentienceAgent, SentienceAgentAsync
 from .agent_config import AgentConfig
 from .agent_runtime import AgentRuntime, AssertionHandle
@@ -38,7 +38,7 @@ from .backends import wait_for_stable as backend_wait_for_stable
 
 # Agent Layer (Phase 1 & 2)
 from .base_agent import BaseAgent
-from .browser import SentienceBrowser
+from .browser import SentienceBrowser, SentienceBrowserPool
 
 # Tracing (v0.12.0+)
 from .cloud_tracing import CloudTraceSink, SentienceLogger
@@ -161,6 +161,7 @@ __all__ = [
     "backend_wait_for_stable",
     # Core SDK
     "SentienceBrowser",
+    "SentienceBrowserPool",
     "Snapshot",
     "Element",
     "BBox",
@@ -175,6 +176,8 @@ __all__ = [
     "press",
     "scroll_to",
     "click_rect",
+    "type_at",
+    "run_plan",
     "CursorPolicy",
     "wait_for",
     "expect",
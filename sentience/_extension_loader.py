@@ -6,16 +6,33 @@ Provides:
 - verify_extension_injected(): Verifies window.sentience API is available
 - get_extension_version(): Gets extension version from manifest
 - verify_extension_version(): Checks SDK-extension version compatibility
+- get_cached_extension_dir(): Returns a shared, content-addressed copy of the extension
+- start_orphan_cleanup(): Removes temp extension copies left behind by crashed processes
 """
 
+import functools
+import hashlib
 import json
+import os
+import shutil
+import tempfile
+import threading
+import time
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
     from .protocols import AsyncPageProtocol, PageProtocol
 
+# Private per-launch copies are named sentience-ext-<pid>-<random> so orphans can be
+# attributed to the process that created them
+TEMP_EXTENSION_PREFIX = "sentience-ext-"
 
+_orphan_cleanup_started = False
+_orphan_cleanup_lock = threading.Lock()
+
+
+@functools.lru_cache(maxsize=1)
 def find_extension_path() -> Path:
     """
     Find Sentience extension directory (shared logic for sync and async).
@@ -24,6 +41,9 @@ def find_extension_path() -> Path:
     1. sentience/extension/ (installed package)
     2. ../sentience-chrome (development/monorepo)
 
+    The result is cached for the life of the process (failures are not cached);
+    call find_extension_path.cache_clear() to force a new lookup.
+
     Returns:
         Path to extension directory
 
@@ -51,6 +71,163 @@ def find_extension_path() -> Path:
         )
 
 
+def _user_cache_dir() -> Path:
+    """Return the per-user cache directory for Sentience (XDG on POSIX, LOCALAPPDATA on Windows)."""
+    if os.name == "nt" and os.environ.get("LOCALAPPDATA"):
+        base = Path(os.environ["LOCALAPPDATA"])
+    elif os.environ.get("XDG_CACHE_HOME"):
+        base = Path(os.environ["XDG_CACHE_HOME"])
+    else:
+        base = Path.home() / ".cache"
+    return base / "sentience"
+
+
+@functools.lru_cache(maxsize=8)
+def _extension_fingerprint(extension_source: Path) -> str:
+    """
+    Hash the extension tree by (relative path, size, mtime) without reading file contents.
+
+    Any rebuild of the extension changes sizes/mtimes and therefore the fingerprint.
+    The tree is walked once per process for each (resolved) source path; call
+    _extension_fingerprint.cache_clear() to pick up a rebuild without restarting.
+    """
+    digest = hashlib.blake2b(digest_size=8)
+    for path in sorted(p for p in extension_source.rglob("*") if p.is_file()):
+        st = path.stat()
+        digest.update(f"{path.relative_to(extension_source).as_posix()}\0".encode())
+        digest.update(f"{st.st_size}:{st.st_mtime_ns}\n".encode())
+    return digest.hexdigest()
+
+
+def extension_cache_disabled() -> bool:
+    """Check SENTIENCE_EXT_CACHE=0, which asks for a private extension copy per browser"""
+    return os.environ.get("SENTIENCE_EXT_CACHE", "1").lower() in ("0", "false", "no")
+
+
+def get_cached_extension_dir(extension_source: Path | None = None) -> Path | None:
+    """
+    Get a shared copy of the extension under the user cache dir (~/.cache/sentience/ext-<hash>).
+
+    The bundle is copied once per extension build and reused by every browser instance,
+    so start() no longer pays for a full copytree. Callers must treat the directory as
+    shared and never delete it.
+
+    Set SENTIENCE_EXT_CACHE=0 to disable the cache (callers fall back to a temp copy).
+
+    Args:
+        extension_source: Extension directory to cache (defaults to find_extension_path())
+
+    Returns:
+        Path to the cached extension directory, or None if caching is disabled or the
+        cache directory is not writable
+    """
+    if extension_cache_disabled():
+        return None
+
+    try:
+        source = extension_source or find_extension_path()
+        target = _user_cache_dir() / f"ext-{_extension_fingerprint(source.resolve())}"
+        if (target / "manifest.json").exists():
+            return target
+
+        # Copy into a private staging dir, then atomically rename into place so that
+        # concurrent processes (and threads of one process) never observe or clobber a
+        # half-written bundle.
+        target.parent.mkdir(parents=True, exist_ok=True)
+        staging = target.with_name(f"{target.name}.tmp-{os.getpid()}-{threading.get_ident()}")
+        shutil.rmtree(staging, ignore_errors=True)
+        shutil.copytree(source, staging, copy_function=link_or_copy)
+        try:
+            os.replace(staging, target)
+        except OSError:
+            # Another process won the race; use its copy
+            shutil.rmtree(staging, ignore_errors=True)
+            if not (target / "manifest.json").exists():
+                raise
+        return target
+    except OSError:
+        return None
+
+
+def link_or_copy(src: str, dst: str) -> str:
+    """
+    copytree() copy_function that hardlinks files and falls back to a byte copy.
+
+    Chromium never writes into an unpacked extension, so a linked tree is as good as
+    a private copy and costs one metadata update per file instead of the file data.
+    Cross-device targets and filesystems without hardlinks fall back to shutil.copy2.
+    """
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copy2(src, dst)
+    return dst
+
+
+def _pid_alive(pid: int) -> bool:
+    """Check whether a process exists (POSIX only)"""
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except OSError:
+        # EPERM etc.: the process exists but belongs to someone else
+        return True
+    return True
+
+
+def cleanup_orphaned_extension_dirs(max_age_sec: float = 3600.0) -> int:
+    """
+    Delete temp extension copies whose owning process is gone.
+
+    Only directories named sentience-ext-<pid>-* that are older than max_age_sec
+    and whose pid is no longer running are removed.
+
+    Args:
+        max_age_sec: Minimum age (by mtime) before a directory is considered
+
+    Returns:
+        Number of directories removed
+    """
+    if os.name == "nt":
+        # os.kill(pid, 0) terminates the target process on Windows
+        return 0
+
+    removed = 0
+    now = time.time()
+    try:
+        candidates = list(Path(tempfile.gettempdir()).glob(f"{TEMP_EXTENSION_PREFIX}*-*"))
+    except OSError:
+        return 0
+
+    for path in candidates:
+        pid_str = path.name[len(TEMP_EXTENSION_PREFIX) :].split("-", 1)[0]
+        if not pid_str.isdigit() or int(pid_str) == os.getpid():
+            continue
+        try:
+            if now - path.stat().st_mtime < max_age_sec:
+                continue
+        except OSError:
+            continue
+        if _pid_alive(int(pid_str)):
+            continue
+        shutil.rmtree(path, ignore_errors=True)
+        removed += 1
+    return removed
+
+
+def start_orphan_cleanup() -> None:
+    """Run cleanup_orphaned_extension_dirs() once per process in a daemon thread"""
+    global _orphan_cleanup_started
+    with _orphan_cleanup_lock:
+        if _orphan_cleanup_started:
+            return
+        _orphan_cleanup_started = True
+    threading.Thread(
+        target=cleanup_orphaned_extension_dirs, name="sentience-ext-cleanup", daemon=True
+    ).start()
+
+
 def get_extension_dir() -> str:
     """
     Get path to the bundled Sentience extension directory.
@@ -1,10 +1,11 @@
-from typing import Optional
+from typing import Literal, Optional
 
 """
 Actions v1 - click, type, press
 """
 
 import asyncio
+import itertools
 import time
 
 from .browser import AsyncSentienceBrowser, SentienceBrowser
@@ -15,12 +16,150 @@ from .sentience_methods import SentienceMethod
 from .snapshot import snapshot, snapshot_async
 
 
+# One run_plan() step: ("click", element_id), ("type", element_id, text) or ("press", key)
+PlanStep = (
+    tuple[Literal["click"], int] | tuple[Literal["type"], int, str] | tuple[Literal["press"], str]
+)
+
+# Per-process sequence for highlight overlay element ids
+_highlight_ids = itertools.count()
+
+
+def _last_snapshot_for_current_url(
+    browser: SentienceBrowser | AsyncSentienceBrowser,
+) -> Snapshot | None:
+    """Return the browser's most recent snapshot if it was taken on the page's current URL"""
+    snap = getattr(browser, "_last_snapshot", None)
+    if snap is not None and getattr(browser, "_last_snapshot_url", None) == browser.page.url:
+        return snap
+    return None
+
+
+def _invalidate_last_snapshot(browser: SentienceBrowser | AsyncSentienceBrowser) -> None:
+    """Forget the cached snapshot after an action may have changed the page"""
+    if hasattr(browser, "_snapshot_generation"):
+        browser._last_snapshot = None
+        browser._last_snapshot_url = None
+        # Also keeps a snapshot still in flight (e.g. an eager_return task) out of the cache
+        browser._snapshot_generation += 1
+
+
+# Minimum settle after an action before a DOM mutation ends the wait, so a click-triggered
+# navigation has time to commit before url_after is read
+_DOM_SETTLE_MIN_MS = 100
+
+# Returns the page's DOM mutation counter, installing the MutationObserver on first use.
+# Only structural/text changes count: attribute churn from hover/focus/:active styling
+# right after a click would otherwise end the wait immediately.
+_MUTATION_SEQ_JS = """
+() => {
+    if (typeof window.__sentience_mut !== 'number') {
+        window.__sentience_mut = 0;
+        new MutationObserver(() => { window.__sentience_mut++; }).observe(document, {
+            subtree: true, childList: true, characterData: true
+        });
+    }
+    window.__sentience_mut_at = performance.now();
+    return window.__sentience_mut;
+}
+"""
+
+# True once the DOM mutated past `seq` and _DOM_SETTLE_MIN_MS passed since it was read,
+# or a navigation replaced the document
+_DOM_CHANGED_JS = (
+    "(seq) => typeof window.__sentience_mut !== 'number' || (window.__sentience_mut > seq"
+    f" && performance.now() - window.__sentience_mut_at >= {_DOM_SETTLE_MIN_MS})"
+)
+
+
+def _can_insert_text(text: str, delay_ms: float, fast: bool) -> bool:
+    """
+    Whether text can be sent with one keyboard.insert_text() call instead of per-key events.
+
+    Only when the caller opted in with fast=True, for instant typing of plain text;
+    control characters (Enter, Tab, ...) still go through keyboard.type() so they act
+    as key presses.
+    """
+    return fast and not delay_ms and text.isprintable()
+
+
+def _read_mutation_seq(page) -> int | None:
+    """Read the DOM mutation counter before an action (None if unavailable)"""
+    try:
+        seq = page.evaluate(_MUTATION_SEQ_JS)
+    except Exception:
+        return None
+    return seq if isinstance(seq, int) else None
+
+
+def _wait_for_dom_change(page, mutation_seq: int | None, timeout_ms: int = 500) -> None:
+    """
+    Wait for the DOM to react to an action, returning as soon as it mutates.
+
+    Capped at timeout_ms; falls back to a fixed wait if the counter was unavailable.
+    """
+    try:
+        if mutation_seq is None:
+            page.wait_for_timeout(timeout_ms)
+        else:
+            page.wait_for_function(_DOM_CHANGED_JS, arg=mutation_seq, timeout=timeout_ms)
+    except Exception:
+        # No DOM change within timeout_ms, or navigation destroyed the context
+        pass
+
+
+async def _snapshot_after_async(
+    browser: AsyncSentienceBrowser, take_snapshot: bool, eager_return: bool
+) -> tuple[Snapshot | None, "asyncio.Future[Snapshot] | None"]:
+    """
+    Take the post-action snapshot, or start it in the background when eager_return is set.
+
+    Returns:
+        (snapshot, None) normally, or (None, task) with eager_return
+    """
+    if not take_snapshot:
+        return None, None
+    if eager_return:
+        return None, asyncio.ensure_future(snapshot_async(browser))
+    return await snapshot_async(browser), None
+
+
+def _with_snapshot_task(
+    result: ActionResult, task: "asyncio.Future[Snapshot] | None"
+) -> ActionResult:
+    """Attach a pending eager_return snapshot to an ActionResult"""
+    result._snapshot_after_task = task
+    return result
+
+
+async def _read_mutation_seq_async(page) -> int | None:
+    """Read the DOM mutation counter before an action (async)"""
+    try:
+        seq = await page.evaluate(_MUTATION_SEQ_JS)
+    except Exception:
+        return None
+    return seq if isinstance(seq, int) else None
+
+
+async def _wait_for_dom_change_async(page, mutation_seq: int | None, timeout_ms: int = 500) -> None:
+    """Wait for the DOM to react to an action, returning as soon as it mutates (async)"""
+    try:
+        if mutation_seq is None:
+            await page.wait_for_timeout(timeout_ms)
+        else:
+            await page.wait_for_function(_DOM_CHANGED_JS, arg=mutation_seq, timeout=timeout_ms)
+    except Exception:
+        # No DOM change within timeout_ms, or navigation destroyed the context
+        pass
+
+
 def click(  # noqa: C901
     browser: SentienceBrowser,
     element_id: int,
     use_mouse: bool = True,
     take_snapshot: bool = False,
     cursor_policy: CursorPolicy | None = None,
+    reuse_snapshot: bool | Snapshot = False,
 ) -> ActionResult:
     """
     Click an element by ID using hybrid approach (mouse simulation by default)
@@ -31,6 +170,10 @@ def click(  # noqa: C901
         use_mouse: If True, use Playwright's mouse.click() at element center (hybrid approach).
                    If False, use JS-based window.sentience.click() (legacy).
         take_snapshot: Whether to take snapshot after action
+        reuse_snapshot: If True, take the element bbox from the browser's latest snapshot
+                        when it was taken on the current URL, instead of a fresh snapshot.
+                        A Snapshot takes the bbox from that snapshot instead. Only safe if
+                        nothing scrolled or changed the page since then.
 
     Returns:
         ActionResult
@@ -38,19 +181,29 @@ def click(  # noqa: C901
     if not browser.page:
         raise RuntimeError("Browser not started. Call browser.start() first.")
 
-    start_time = time.time()
+    start_time = time.monotonic()
     url_before = browser.page.url
     cursor_meta: dict | None = None
+    mutation_seq: int | None = None
 
     if use_mouse:
         # Hybrid approach: Get element bbox from snapshot, calculate center, use mouse.click()
         try:
-            snap = snapshot(browser)
+            # Opt-in: reuse the snapshot the caller just took on this page (typical
+            # snapshot -> click loop); only re-snapshot on a cache miss
             element = None
-            for el in snap.elements:
-                if el.id == element_id:
-                    element = el
-                    break
+            if isinstance(reuse_snapshot, Snapshot):
+                snap = reuse_snapshot
+            else:
+                snap = _last_snapshot_for_current_url(browser) if reuse_snapshot else None
+            if snap is not None:
+                element = snap.by_id.get(element_id)
+            if element is None:
+                snap = snapshot(browser)
+                element = snap.by_id.get(element_id)
+
+            # Baseline DOM mutation count, read after the snapshot so its own DOM writes don't count
+            mutation_seq = _read_mutation_seq(browser.page)
 
             if element:
                 # Calculate center of element bbox
@@ -122,16 +275,13 @@ def click(  # noqa: C901
                 success = True
     else:
         # Legacy JS-based click
+        mutation_seq = _read_mutation_seq(browser.page)
         success = BrowserEvaluator.invoke(browser.page, SentienceMethod.CLICK, element_id)
 
-    # Wait a bit for navigation/DOM updates
-    try:
-        browser.page.wait_for_timeout(500)
-    except Exception:
-        # Navigation might have happened, context destroyed
-        pass
+    # Wait for navigation/DOM updates (returns early once the DOM changes)
+    _wait_for_dom_change(browser.page, mutation_seq)
 
-    duration_ms = int((time.time() - start_time) * 1000)
+    duration_ms = int((time.monotonic() - start_time) * 1000)
 
     # Check if URL changed (handle navigation gracefully)
     try:
@@ -152,6 +302,7 @@ def click(  # noqa: C901
         outcome = "error"
 
     # Optional snapshot after
+    _invalidate_last_snapshot(browser)
     snapshot_after: Snapshot | None = None
     if take_snapshot:
         try:
@@ -184,6 +335,7 @@ def type_text(
     text: str,
     take_snapshot: bool = False,
     delay_ms: float = 0,
+    fast: bool = False,
 ) -> ActionResult:
     """
     Type text into an element (focus then input)
@@ -194,6 +346,9 @@ def type_text(
         text: Text to type
         take_snapshot: Whether to take snapshot after action
         delay_ms: Delay between keystrokes in milliseconds for human-like typing (default: 0)
+        fast: If True (and delay_ms is 0), insert plain text in one step instead of
+            typing key by key. Only input events fire, no keydown/keypress/keyup, so
+            avoid it for fields that react to key events (autocomplete, key handlers).
 
     Returns:
         ActionResult
@@ -207,7 +362,7 @@ def type_text(
     if not browser.page:
         raise RuntimeError("Browser not started. Call browser.start() first.")
 
-    start_time = time.time()
+    start_time = time.monotonic()
     url_before = browser.page.url
 
     # Focus element first using extension registry
@@ -228,20 +383,25 @@ def type_text(
     if not focused:
         return ActionResult(
             success=False,
-            duration_ms=int((time.time() - start_time) * 1000),
+            duration_ms=int((time.monotonic() - start_time) * 1000),
             outcome="error",
             error={"code": "focus_failed", "reason": "Element not found"},
         )
 
-    # Type using Playwright keyboard with optional delay between keystrokes
-    browser.page.keyboard.type(text, delay=delay_ms)
+    # With fast=True, instant typing inserts the whole string in one CDP call; otherwise
+    # type key by key with the optional delay between keystrokes
+    if _can_insert_text(text, delay_ms, fast):
+        browser.page.keyboard.insert_text(text)
+    else:
+        browser.page.keyboard.type(text, delay=delay_ms)
 
-    duration_ms = int((time.time() - start_time) * 1000)
+    duration_ms = int((time.monotonic() - start_time) * 1000)
     url_after = browser.page.url
     url_changed = url_before != url_after
 
     outcome = "navigated" if url_changed else "dom_updated"
 
+    _invalidate_last_snapshot(browser)
     snapshot_after: Snapshot | None = None
     if take_snapshot:
         snapshot_after = snapshot(browser)
@@ -270,21 +430,24 @@ def press(browser: SentienceBrowser, key: str, take_snapshot: bool = False) -> A
     if not browser.page:
         raise RuntimeError("Browser not started. Call browser.start() first.")
 
-    start_time = time.time()
+    start_time = time.monotonic()
     url_before = browser.page.url
 
+    mutation_seq = _read_mutation_seq(browser.page)
+
     # Press key using Playwright
     browser.page.keyboard.press(key)
 
-    # Wait a bit for navigation/DOM updates
-    browser.page.wait_for_timeout(500)
+    # Wait for navigation/DOM updates (returns early once the DOM reacts)
+    _wait_for_dom_change(browser.page, mutation_seq)
 
-    duration_ms = int((time.time() - start_time) * 1000)
+    duration_ms = int((time.monotonic() - start_time) * 1000)
     url_after = browser.page.url
     url_changed = url_before != url_after
 
     outcome = "navigated" if url_changed else "dom_updated"
 
+    _invalidate_last_snapshot(browser)
     snapshot_after: Snapshot | None = None
     if take_snapshot:
         snapshot_after = snapshot(browser)
@@ -298,6 +461,80 @@ def press(browser: SentienceBrowser, key: str, take_snapshot: bool = False) -> A
     )
 
 
+def _plan_result(
+    results: list[ActionResult], duration_ms: int, snapshot_after: Snapshot | None
+) -> ActionResult:
+    """Fold per-step results into one ActionResult (stops at the first failed step)"""
+    url_changed = any(r.url_changed for r in results)
+    last = results[-1] if results else None
+    failed = last is not None and not last.success
+    error = None
+    if failed:
+        error = {**(last.error or {}), "step": len(results) - 1}
+    return ActionResult(
+        success=not failed,
+        duration_ms=duration_ms,
+        outcome="navigated" if url_changed else (last.outcome if last else "no_change"),
+        url_changed=url_changed,
+        snapshot_after=snapshot_after,
+        error=error,
+    )
+
+
+def run_plan(
+    browser: SentienceBrowser, steps: list[PlanStep], final_snapshot: bool = True
+) -> ActionResult:
+    """
+    Run a sequence of click/type/press steps and take one snapshot at the end
+
+    Steps run in order and stop at the first failure. Intermediate steps skip their
+    own snapshot, and click steps take element bboxes from one snapshot per URL (the
+    browser's latest one when it was taken on the current page), so a form fill pays
+    for at most one snapshot before the steps plus the final one. Steps must therefore
+    not move the elements later click steps target.
+
+    Args:
+        browser: SentienceBrowser instance
+        steps: Steps such as ("click", 12), ("type", 15, "hello"), ("press", "Enter")
+        final_snapshot: Whether to snapshot after the last step (also taken after a failure)
+
+    Returns:
+        ActionResult covering the whole plan. On failure, error["step"] is the index of
+        the failed step.
+
+    Example:
+        >>> run_plan(browser, [("type", 15, "user@example.com"), ("press", "Enter")])
+    """
+    if not browser.page:
+        raise RuntimeError("Browser not started. Call browser.start() first.")
+
+    start_time = time.monotonic()
+    results: list[ActionResult] = []
+    plan_snap: Snapshot | None = None
+    plan_snap_url: str | None = None
+    for step in steps:
+        kind = step[0]
+        if kind == "click":
+            # One bbox snapshot per URL, shared by every click step on that page
+            if plan_snap is None or plan_snap_url != browser.page.url:
+                plan_snap_url = browser.page.url
+                plan_snap = _last_snapshot_for_current_url(browser) or snapshot(browser)
+            result = click(browser, step[1], reuse_snapshot=plan_snap)
+        elif kind == "type":
+            result = type_text(browser, step[1], step[2])
+        elif kind == "press":
+            result = press(browser, step[1])
+        else:
+            raise ValueError(f"Unknown plan step: {step!r}")
+        results.append(result)
+        if not result.success:
+            break
+    duration_ms = int((time.monotonic() - start_time) * 1000)
+
+    snapshot_after = snapshot(browser) if final_snapshot else None
+    return _plan_result(results, duration_ms, snapshot_after)
+
+
 def scroll_to(
     browser: SentienceBrowser,
     element_id: int,
@@ -333,7 +570,7 @@ def scroll_to(
     if not browser.page:
         raise RuntimeError("Browser not started. Call browser.start() first.")
 
-    start_time = time.time()
+    start_time = time.monotonic()
     url_before = browser.page.url
 
     # Scroll element into view using the element registry
@@ -358,7 +595,7 @@ def scroll_to(
     if not scrolled:
         return ActionResult(
             success=False,
-            duration_ms=int((time.time() - start_time) * 1000),
+            duration_ms=int((time.monotonic() - start_time) * 1000),
             outcome="error",
             error={"code": "scroll_failed", "reason": "Element not found or not scrollable"},
         )
@@ -367,12 +604,13 @@ def scroll_to(
     wait_time = 500 if behavior == "smooth" else 100
     browser.page.wait_for_timeout(wait_time)
 
-    duration_ms = int((time.time() - start_time) * 1000)
+    duration_ms = int((time.monotonic() - start_time) * 1000)
     url_after = browser.page.url
     url_changed = url_before != url_after
 
     outcome = "navigated" if url_changed else "dom_updated"
 
+    _invalidate_last_snapshot(browser)
     snapshot_after: Snapshot | None = None
     if take_snapshot:
         snapshot_after = snapshot(browser)
@@ -386,6 +624,64 @@ def scroll_to(
     )
 
 
+# Overlay renderer, installed once per document as window.__sentience_highlight
+_HIGHLIGHT_FN_JS = """
+(args) => {
+    const { rect, highlightId, durationSec } = args;
+    // Reuse hidden overlays from earlier highlights instead of creating/removing nodes
+    const pool = window.__sentience_highlight_pool || (window.__sentience_highlight_pool = []);
+    let overlay = pool.pop();
+    if (!overlay || !overlay.isConnected) {
+        overlay = document.createElement('div');
+        overlay.style.cssText = [
+            'position: fixed',
+            'border: 3px solid red',
+            'border-radius: 2px',
+            'box-sizing: border-box',
+            'pointer-events: none',
+            'z-index: 999999',
+            'background-color: rgba(255, 0, 0, 0.1)',
+            'transition: opacity 0.3s ease-out',
+        ].join(';');
+        document.body.appendChild(overlay);
+    }
+    overlay.id = highlightId;
+    overlay.style.left = `${rect.x}px`;
+    overlay.style.top = `${rect.y}px`;
+    overlay.style.width = `${rect.w}px`;
+    overlay.style.height = `${rect.h}px`;
+    // Coming back from display: none, so the opacity change doesn't animate
+    overlay.style.opacity = '1';
+    overlay.style.display = 'block';
+
+    // Hide after duration and return the overlay to the pool
+    setTimeout(() => {
+        overlay.style.opacity = '0';
+        setTimeout(() => {
+            overlay.style.display = 'none';
+            pool.push(overlay);
+        }, 300); // Wait for fade-out transition
+    }, durationSec * 1000);
+}
+"""
+
+# Calls the installed renderer; returns false if this document doesn't have it yet
+_HIGHLIGHT_CALL_JS = """
+(args) => {
+    if (typeof window.__sentience_highlight !== 'function') return false;
+    window.__sentience_highlight(args);
+    return true;
+}
+"""
+
+_HIGHLIGHT_INSTALL_JS = f"""
+(args) => {{
+    window.__sentience_highlight = {_HIGHLIGHT_FN_JS.strip()};
+    window.__sentience_highlight(args);
+}}
+"""
+
+
 def _highlight_rect(
     browser: SentienceBrowser, rect: dict[str, float], duration_sec: float = 2.0
 ) -> None:
@@ -401,7 +697,7 @@ def _highlight_rect(
         return
 
     # Create a unique ID for this highlight
-    highlight_id = f"sentience_highlight_{int(time.time() * 1000)}"
+    highlight_id = f"sentience_highlight_{next(_highlight_ids)}"
 
     # Combine all arguments into a single object for Playwright
     args = {
@@ -415,42 +711,38 @@ def _highlight_rect(
         "durationSec": duration_sec,
     }
 
-    # Inject CSS and create overlay element
-    browser.page.evaluate(
-        """
-        (args) => {
-            const { rect, highlightId, durationSec } = args;
-            // Create overlay div
-            const overlay = document.createElement('div');
-            overlay.id = highlightId;
-            overlay.style.position = 'fixed';
-            overlay.style.left = `${rect.x}px`;
-            overlay.style.top = `${rect.y}px`;
-            overlay.style.width = `${rect.w}px`;
-            overlay.style.height = `${rect.h}px`;
-            overlay.style.border = '3px solid red';
-            overlay.style.borderRadius = '2px';
-            overlay.style.boxSizing = 'border-box';
-            overlay.style.pointerEvents = 'none';
-            overlay.style.zIndex = '999999';
-            overlay.style.backgroundColor = 'rgba(255, 0, 0, 0.1)';
-            overlay.style.transition = 'opacity 0.3s ease-out';
-
-            document.body.appendChild(overlay);
-
-            // Remove after duration
-            setTimeout(() => {
-                overlay.style.opacity = '0';
-                setTimeout(() => {
-                    if (overlay.parentNode) {
-                        overlay.parentNode.removeChild(overlay);
-                    }
-                }, 300); // Wait for fade-out transition
-            }, durationSec * 1000);
-        }
-        """,
-        args,
-    )
+    # Only the small args payload crosses CDP once the renderer is installed
+    if not browser.page.evaluate(_HIGHLIGHT_CALL_JS, args):
+        browser.page.evaluate(_HIGHLIGHT_INSTALL_JS, args)
+
+
+def _rect_bounds(rect: dict[str, float] | BBox) -> tuple[float, float, float, float] | None:
+    """(x, y, w, h) of a BBox or {x, y, w|width, h|height} dict (None if the rect is empty)"""
+    if isinstance(rect, BBox):
+        x, y, w, h = rect.x, rect.y, rect.width, rect.height
+    else:
+        x = rect.get("x", 0)
+        y = rect.get("y", 0)
+        w = rect.get("w") or rect.get("width", 0)
+        h = rect.get("h") or rect.get("height", 0)
+    if w <= 0 or h <= 0:
+        return None
+    return x, y, w, h
+
+
+def _rect_center(rect: dict[str, float] | BBox) -> tuple[float, float] | None:
+    """Center of a BBox or {x, y, w|width, h|height} dict (None if the rect is empty)"""
+    bounds = _rect_bounds(rect)
+    if bounds is None:
+        return None
+    x, y, w, h = bounds
+    return x + w / 2, y + h / 2
+
+
+_INVALID_RECT_ERROR = {
+    "code": "invalid_rect",
+    "reason": "Rectangle width and height must be positive",
+}
 
 
 def click_rect(
@@ -487,41 +779,26 @@ def click_rect(
         raise RuntimeError("Browser not started. Call browser.start() first.")
 
     # Handle BBox object or dict
-    if isinstance(rect, BBox):
-        x = rect.x
-        y = rect.y
-        w = rect.width
-        h = rect.height
-    else:
-        x = rect.get("x", 0)
-        y = rect.get("y", 0)
-        w = rect.get("w") or rect.get("width", 0)
-        h = rect.get("h") or rect.get("height", 0)
-
-    if w <= 0 or h <= 0:
+    bounds = _rect_bounds(rect)
+    if bounds is None:
         return ActionResult(
-            success=False,
-            duration_ms=0,
-            outcome="error",
-            error={
-                "code": "invalid_rect",
-                "reason": "Rectangle width and height must be positive",
-            },
+            success=False, duration_ms=0, outcome="error", error=dict(_INVALID_RECT_ERROR)
         )
+    x, y, w, h = bounds
 
-    start_time = time.time()
+    start_time = time.monotonic()
     url_before = browser.page.url
 
-    # Calculate center of rectangle
-    center_x = x + w / 2
-    center_y = y + h / 2
+    center_x, center_y = _rect_center(rect)
     cursor_meta: dict | None = None
 
     # Show highlight before clicking (if enabled)
     if highlight:
+        # The overlay has pointer-events: none, so the click can follow immediately
         _highlight_rect(browser, {"x": x, "y": y, "w": w, "h": h}, highlight_duration)
-        # Small delay to ensure highlight is visible
-        browser.page.wait_for_timeout(50)
+
+    # Read after the highlight so its overlay doesn't count as a DOM change
+    mutation_seq = _read_mutation_seq(browser.page)
 
     # Use Playwright's native mouse click for realistic simulation
     # This triggers hover, focus, mousedown, mouseup sequences
@@ -560,10 +837,10 @@ def click_rect(
         success = False
         error_msg = str(e)
 
-    # Wait a bit for navigation/DOM updates
-    browser.page.wait_for_timeout(500)
+    # Wait for navigation/DOM updates (returns early once the DOM reacts)
+    _wait_for_dom_change(browser.page, mutation_seq)
 
-    duration_ms = int((time.time() - start_time) * 1000)
+    duration_ms = int((time.monotonic() - start_time) * 1000)
     url_after = browser.page.url
     url_changed = url_before != url_after
 
@@ -577,6 +854,7 @@ def click_rect(
         outcome = "error"
 
     # Optional snapshot after
+    _invalidate_last_snapshot(browser)
     snapshot_after: Snapshot | None = None
     if take_snapshot:
         snapshot_after = snapshot(browser)
@@ -599,6 +877,85 @@ def click_rect(
     )
 
 
+def type_at(
+    browser: SentienceBrowser,
+    rect: dict[str, float] | BBox,
+    text: str,
+    take_snapshot: bool = False,
+    delay_ms: float = 0,
+    fast: bool = False,
+) -> ActionResult:
+    """
+    Focus an input by clicking its bounding box, then type into it
+
+    Prefer this over type_text() when you already hold a Snapshot: it uses the element's
+    bbox directly, so there is no registry lookup in the page before typing.
+
+    Args:
+        browser: SentienceBrowser instance
+        rect: Element bbox (BBox, or dict with x, y, w/width, h/height)
+        text: Text to type
+        take_snapshot: Whether to take snapshot after action
+        delay_ms: Delay between keystrokes in milliseconds (see type_text)
+        fast: Insert plain text in one step without key events (see type_text)
+
+    Returns:
+        ActionResult
+
+    Example:
+        >>> field = find(snap, "role=textbox")
+        >>> type_at(browser, field.bbox, "hello")
+    """
+    if not browser.page:
+        raise RuntimeError("Browser not started. Call browser.start() first.")
+
+    center = _rect_center(rect)
+    if center is None:
+        return ActionResult(
+            success=False, duration_ms=0, outcome="error", error=dict(_INVALID_RECT_ERROR)
+        )
+
+    start_time = time.monotonic()
+    url_before = browser.page.url
+
+    try:
+        browser.page.mouse.click(*center)
+        if _can_insert_text(text, delay_ms, fast):
+            browser.page.keyboard.insert_text(text)
+        else:
+            browser.page.keyboard.type(text, delay=delay_ms)
+        success = True
+    except Exception as e:
+        success = False
+        error_msg = str(e)
+
+    duration_ms = int((time.monotonic() - start_time) * 1000)
+    url_changed = url_before != browser.page.url
+
+    # Determine outcome
+    outcome: str | None = None
+    if url_changed:
+        outcome = "navigated"
+    elif success:
+        outcome = "dom_updated"
+    else:
+        outcome = "error"
+
+    _invalidate_last_snapshot(browser)
+    snapshot_after: Snapshot | None = None
+    if take_snapshot:
+        snapshot_after = snapshot(browser)
+
+    return ActionResult(
+        success=success,
+        duration_ms=duration_ms,
+        outcome=outcome,
+        url_changed=url_changed,
+        snapshot_after=snapshot_after,
+        error=None if success else {"code": "type_failed", "reason": error_msg},
+    )
+
+
 # ========== Async Action Functions ==========
 
 
@@ -608,6 +965,7 @@ async def click_async(
     use_mouse: bool = True,
     take_snapshot: bool = False,
     cursor_policy: CursorPolicy | None = None,
+    reuse_snapshot: bool | Snapshot = False,
 ) -> ActionResult:
     """
     Click an element by ID using hybrid approach (async)
@@ -617,6 +975,10 @@ async def click_async(
         element_id: Element ID from snapshot
         use_mouse: If True, use Playwright's mouse.click() at element center
         take_snapshot: Whether to take snapshot after action
+        reuse_snapshot: If True, take the element bbox from the browser's latest snapshot
+                        when it was taken on the current URL, instead of a fresh snapshot.
+                        A Snapshot takes the bbox from that snapshot instead. Only safe if
+                        nothing scrolled or changed the page since then.
 
     Returns:
         ActionResult
@@ -624,18 +986,28 @@ async def click_async(
     if not browser.page:
         raise RuntimeError("Browser not started. Call await browser.start() first.")
 
-    start_time = time.time()
+    start_time = time.monotonic()
     url_before = browser.page.url
     cursor_meta: dict | None = None
+    mutation_seq: int | None = None
 
     if use_mouse:
         try:
-            snap = await snapshot_async(browser)
+            # Opt-in: reuse the snapshot the caller just took on this page (typical
+            # snapshot -> click loop); only re-snapshot on a cache miss
             element = None
-            for el in snap.elements:
-                if el.id == element_id:
-                    element = el
-                    break
+            if isinstance(reuse_snapshot, Snapshot):
+                snap = reuse_snapshot
+            else:
+                snap = _last_snapshot_for_current_url(browser) if reuse_snapshot else None
+            if snap is not None:
+                element = snap.by_id.get(element_id)
+            if element is None:
+                snap = await snapshot_async(browser)
+                element = snap.by_id.get(element_id)
+
+            # Baseline DOM mutation count, read after the snapshot so its own DOM writes don't count
+            mutation_seq = await _read_mutation_seq_async(browser.page)
 
             if element:
                 center_x = element.bbox.x + element.bbox.width / 2
@@ -707,6 +1079,7 @@ async def click_async(
             except Exception:
                 success = True
     else:
+        mutation_seq = await _read_mutation_seq_async(browser.page)
         success = await browser.page.evaluate(
             """
             (id) => {
@@ -716,13 +1089,10 @@ async def click_async(
             element_id,
         )
 
-    # Wait a bit for navigation/DOM updates
-    try:
-        await browser.page.wait_for_timeout(500)
-    except Exception:
-        pass
+    # Wait for navigation/DOM updates (returns early once the DOM changes)
+    await _wait_for_dom_change_async(browser.page, mutation_seq)
 
-    duration_ms = int((time.time() - start_time) * 1000)
+    duration_ms = int((time.monotonic() - start_time) * 1000)
 
     # Check if URL changed
     try:
@@ -742,6 +1112,7 @@ async def click_async(
         outcome = "error"
 
     # Optional snapshot after
+    _invalidate_last_snapshot(browser)
     snapshot_after: Snapshot | None = None
     if take_snapshot:
         try:
@@ -773,6 +1144,8 @@ async def type_text_async(
     text: str,
     take_snapshot: bool = False,
     delay_ms: float = 0,
+    eager_return: bool = False,
+    fast: bool = False,
 ) -> ActionResult:
     """
     Type text into an element (async)
@@ -783,6 +1156,11 @@ async def type_text_async(
         text: Text to type
         take_snapshot: Whether to take snapshot after action
         delay_ms: Delay between keystrokes in milliseconds for human-like typing (default: 0)
+        eager_return: With take_snapshot, return right after the action and take the
+            snapshot in the background (see ActionResult.snapshot_after_future)
+        fast: If True (and delay_ms is 0), insert plain text in one step instead of
+            typing key by key. Only input events fire, no keydown/keypress/keyup, so
+            avoid it for fields that react to key events (autocomplete, key handlers).
 
     Returns:
         ActionResult
@@ -796,7 +1174,7 @@ async def type_text_async(
     if not browser.page:
         raise RuntimeError("Browser not started. Call await browser.start() first.")
 
-    start_time = time.time()
+    start_time = time.monotonic()
     url_before = browser.page.url
 
     # Focus element first
@@ -817,35 +1195,44 @@ async def type_text_async(
     if not focused:
         return ActionResult(
             success=False,
-            duration_ms=int((time.time() - start_time) * 1000),
+            duration_ms=int((time.monotonic() - start_time) * 1000),
             outcome="error",
             error={"code": "focus_failed", "reason": "Element not found"},
         )
 
-    # Type using Playwright keyboard with optional delay between keystrokes
-    await browser.page.keyboard.type(text, delay=delay_ms)
+    # With fast=True, instant typing inserts the whole string in one CDP call; otherwise
+    # type key by key with the optional delay between keystrokes
+    if _can_insert_text(text, delay_ms, fast):
+        await browser.page.keyboard.insert_text(text)
+    else:
+        await browser.page.keyboard.type(text, delay=delay_ms)
 
-    duration_ms = int((time.time() - start_time) * 1000)
+    duration_ms = int((time.monotonic() - start_time) * 1000)
     url_after = browser.page.url
     url_changed = url_before != url_after
 
     outcome = "navigated" if url_changed else "dom_updated"
 
-    snapshot_after: Snapshot | None = None
-    if take_snapshot:
-        snapshot_after = await snapshot_async(browser)
+    _invalidate_last_snapshot(browser)
+    snapshot_after, snapshot_task = await _snapshot_after_async(
+        browser, take_snapshot, eager_return
+    )
 
-    return ActionResult(
+    result = ActionResult(
         success=True,
         duration_ms=duration_ms,
         outcome=outcome,
         url_changed=url_changed,
         snapshot_after=snapshot_after,
     )
+    return _with_snapshot_task(result, snapshot_task)
 
 
 async def press_async(
-    browser: AsyncSentienceBrowser, key: str, take_snapshot: bool = False
+    browser: AsyncSentienceBrowser,
+    key: str,
+    take_snapshot: bool = False,
+    eager_return: bool = False,
 ) -> ActionResult:
     """
     Press a keyboard key (async)
@@ -854,6 +1241,8 @@ async def press_async(
         browser: AsyncSentienceBrowser instance
         key: Key to press (e.g., "Enter", "Escape", "Tab")
         take_snapshot: Whether to take snapshot after action
+        eager_return: With take_snapshot, return right after the action and take the
+            snapshot in the background (see ActionResult.snapshot_after_future)
 
     Returns:
         ActionResult
@@ -861,32 +1250,36 @@ async def press_async(
     if not browser.page:
         raise RuntimeError("Browser not started. Call await browser.start() first.")
 
-    start_time = time.time()
+    start_time = time.monotonic()
     url_before = browser.page.url
 
+    mutation_seq = await _read_mutation_seq_async(browser.page)
+
     # Press key using Playwright
     await browser.page.keyboard.press(key)
 
-    # Wait a bit for navigation/DOM updates
-    await browser.page.wait_for_timeout(500)
+    # Wait for navigation/DOM updates (returns early once the DOM reacts)
+    await _wait_for_dom_change_async(browser.page, mutation_seq)
 
-    duration_ms = int((time.time() - start_time) * 1000)
+    duration_ms = int((time.monotonic() - start_time) * 1000)
     url_after = browser.page.url
     url_changed = url_before != url_after
 
     outcome = "navigated" if url_changed else "dom_updated"
 
-    snapshot_after: Snapshot | None = None
-    if take_snapshot:
-        snapshot_after = await snapshot_async(browser)
+    _invalidate_last_snapshot(browser)
+    snapshot_after, snapshot_task = await _snapshot_after_async(
+        browser, take_snapshot, eager_return
+    )
 
-    return ActionResult(
+    result = ActionResult(
         success=True,
         duration_ms=duration_ms,
         outcome=outcome,
         url_changed=url_changed,
         snapshot_after=snapshot_after,
     )
+    return _with_snapshot_task(result, snapshot_task)
 
 
 async def scroll_to_async(
@@ -924,7 +1317,7 @@ async def scroll_to_async(
     if not browser.page:
         raise RuntimeError("Browser not started. Call await browser.start() first.")
 
-    start_time = time.time()
+    start_time = time.monotonic()
     url_before = browser.page.url
 
     # Scroll element into view using the element registry
@@ -949,7 +1342,7 @@ async def scroll_to_async(
     if not scrolled:
         return ActionResult(
             success=False,
-            duration_ms=int((time.time() - start_time) * 1000),
+            duration_ms=int((time.monotonic() - start_time) * 1000),
             outcome="error",
             error={"code": "scroll_failed", "reason": "Element not found or not scrollable"},
         )
@@ -958,12 +1351,13 @@ async def scroll_to_async(
     wait_time = 500 if behavior == "smooth" else 100
     await browser.page.wait_for_timeout(wait_time)
 
-    duration_ms = int((time.time() - start_time) * 1000)
+    duration_ms = int((time.monotonic() - start_time) * 1000)
     url_after = browser.page.url
     url_changed = url_before != url_after
 
     outcome = "navigated" if url_changed else "dom_updated"
 
+    _invalidate_last_snapshot(browser)
     snapshot_after: Snapshot | None = None
     if take_snapshot:
         snapshot_after = await snapshot_async(browser)
@@ -984,7 +1378,7 @@ async def _highlight_rect_async(
     if not browser.page:
         return
 
-    highlight_id = f"sentience_highlight_{int(time.time() * 1000)}"
+    highlight_id = f"sentience_highlight_{next(_highlight_ids)}"
 
     args = {
         "rect": {
@@ -997,39 +1391,8 @@ async def _highlight_rect_async(
         "durationSec": duration_sec,
     }
 
-    await browser.page.evaluate(
-        """
-        (args) => {
-            const { rect, highlightId, durationSec } = args;
-            const overlay = document.createElement('div');
-            overlay.id = highlightId;
-            overlay.style.position = 'fixed';
-            overlay.style.left = `${rect.x}px`;
-            overlay.style.top = `${rect.y}px`;
-            overlay.style.width = `${rect.w}px`;
-            overlay.style.height = `${rect.h}px`;
-            overlay.style.border = '3px solid red';
-            overlay.style.borderRadius = '2px';
-            overlay.style.boxSizing = 'border-box';
-            overlay.style.pointerEvents = 'none';
-            overlay.style.zIndex = '999999';
-            overlay.style.backgroundColor = 'rgba(255, 0, 0, 0.1)';
-            overlay.style.transition = 'opacity 0.3s ease-out';
-
-            document.body.appendChild(overlay);
-
-            setTimeout(() => {
-                overlay.style.opacity = '0';
-                setTimeout(() => {
-                    if (overlay.parentNode) {
-                        overlay.parentNode.removeChild(overlay);
-                    }
-                }, 300);
-            }, durationSec * 1000);
-        }
-        """,
-        args,
-    )
+    if not await browser.page.evaluate(_HIGHLIGHT_CALL_JS, args):
+        await browser.page.evaluate(_HIGHLIGHT_INSTALL_JS, args)
 
 
 async def click_rect_async(
@@ -1039,6 +1402,7 @@ async def click_rect_async(
     highlight_duration: float = 2.0,
     take_snapshot: bool = False,
     cursor_policy: CursorPolicy | None = None,
+    eager_return: bool = False,
 ) -> ActionResult:
     """
     Click at the center of a rectangle (async)
@@ -1049,6 +1413,8 @@ async def click_rect_async(
         highlight: Whether to show a red border highlight when clicking
         highlight_duration: How long to show the highlight in seconds
         take_snapshot: Whether to take snapshot after action
+        eager_return: With take_snapshot, return right after the action and take the
+            snapshot in the background (see ActionResult.snapshot_after_future)
 
     Returns:
         ActionResult
@@ -1057,40 +1423,26 @@ async def click_rect_async(
         raise RuntimeError("Browser not started. Call await browser.start() first.")
 
     # Handle BBox object or dict
-    if isinstance(rect, BBox):
-        x = rect.x
-        y = rect.y
-        w = rect.width
-        h = rect.height
-    else:
-        x = rect.get("x", 0)
-        y = rect.get("y", 0)
-        w = rect.get("w") or rect.get("width", 0)
-        h = rect.get("h") or rect.get("height", 0)
-
-    if w <= 0 or h <= 0:
+    bounds = _rect_bounds(rect)
+    if bounds is None:
         return ActionResult(
-            success=False,
-            duration_ms=0,
-            outcome="error",
-            error={
-                "code": "invalid_rect",
-                "reason": "Rectangle width and height must be positive",
-            },
+            success=False, duration_ms=0, outcome="error", error=dict(_INVALID_RECT_ERROR)
         )
+    x, y, w, h = bounds
 
-    start_time = time.time()
+    start_time = time.monotonic()
     url_before = browser.page.url
 
-    # Calculate center of rectangle
-    center_x = x + w / 2
-    center_y = y + h / 2
+    center_x, center_y = _rect_center(rect)
     cursor_meta: dict | None = None
 
     # Show highlight before clicking
     if highlight:
+        # The overlay has pointer-events: none, so the click can follow immediately
         await _highlight_rect_async(browser, {"x": x, "y": y, "w": w, "h": h}, highlight_duration)
-        await browser.page.wait_for_timeout(50)
+
+    # Read after the highlight so its overlay doesn't count as a DOM change
+    mutation_seq = await _read_mutation_seq_async(browser.page)
 
     # Use Playwright's native mouse click
     try:
@@ -1128,10 +1480,10 @@ async def click_rect_async(
         success = False
         error_msg = str(e)
 
-    # Wait a bit for navigation/DOM updates
-    await browser.page.wait_for_timeout(500)
+    # Wait for navigation/DOM updates (returns early once the DOM reacts)
+    await _wait_for_dom_change_async(browser.page, mutation_seq)
 
-    duration_ms = int((time.time() - start_time) * 1000)
+    duration_ms = int((time.monotonic() - start_time) * 1000)
     url_after = browser.page.url
     url_changed = url_before != url_after
 
@@ -1145,11 +1497,12 @@ async def click_rect_async(
         outcome = "error"
 
     # Optional snapshot after
-    snapshot_after: Snapshot | None = None
-    if take_snapshot:
-        snapshot_after = await snapshot_async(browser)
+    _invalidate_last_snapshot(browser)
+    snapshot_after, snapshot_task = await _snapshot_after_async(
+        browser, take_snapshot, eager_return
+    )
 
-    return ActionResult(
+    result = ActionResult(
         success=success,
         duration_ms=duration_ms,
         outcome=outcome,
@@ -1165,3 +1518,120 @@ async def click_rect_async(
             }
         ),
     )
+    return _with_snapshot_task(result, snapshot_task)
+
+
+async def run_plan_async(
+    browser: AsyncSentienceBrowser, steps: list[PlanStep], final_snapshot: bool = True
+) -> ActionResult:
+    """
+    Run a sequence of click/type/press steps and take one snapshot at the end (async)
+
+    Args:
+        browser: AsyncSentienceBrowser instance
+        steps: Steps such as ("click", 12), ("type", 15, "hello"), ("press", "Enter")
+        final_snapshot: Whether to snapshot after the last step (also taken after a failure)
+
+    Returns:
+        ActionResult covering the whole plan (see run_plan)
+    """
+    if not browser.page:
+        raise RuntimeError("Browser not started. Call await browser.start() first.")
+
+    start_time = time.monotonic()
+    results: list[ActionResult] = []
+    plan_snap: Snapshot | None = None
+    plan_snap_url: str | None = None
+    for step in steps:
+        kind = step[0]
+        if kind == "click":
+            # One bbox snapshot per URL, shared by every click step on that page
+            if plan_snap is None or plan_snap_url != browser.page.url:
+                plan_snap_url = browser.page.url
+                plan_snap = _last_snapshot_for_current_url(browser) or await snapshot_async(browser)
+            result = await click_async(browser, step[1], reuse_snapshot=plan_snap)
+        elif kind == "type":
+            result = await type_text_async(browser, step[1], step[2])
+        elif kind == "press":
+            result = await press_async(browser, step[1])
+        else:
+            raise ValueError(f"Unknown plan step: {step!r}")
+        results.append(result)
+        if not result.success:
+            break
+    duration_ms = int((time.monotonic() - start_time) * 1000)
+
+    snapshot_after = await snapshot_async(browser) if final_snapshot else None
+    return _plan_result(results, duration_ms, snapshot_after)
+
+
+async def type_at_async(
+    browser: AsyncSentienceBrowser,
+    rect: dict[str, float] | BBox,
+    text: str,
+    take_snapshot: bool = False,
+    delay_ms: float = 0,
+    fast: bool = False,
+) -> ActionResult:
+    """
+    Focus an input by clicking its bounding box, then type into it (async)
+
+    Args:
+        browser: AsyncSentienceBrowser instance
+        rect: Element bbox (BBox, or dict with x, y, w/width, h/height)
+        text: Text to type
+        take_snapshot: Whether to take snapshot after action
+        delay_ms: Delay between keystrokes in milliseconds (see type_text_async)
+        fast: Insert plain text in one step without key events (see type_text_async)
+
+    Returns:
+        ActionResult
+    """
+    if not browser.page:
+        raise RuntimeError("Browser not started. Call await browser.start() first.")
+
+    center = _rect_center(rect)
+    if center is None:
+        return ActionResult(
+            success=False, duration_ms=0, outcome="error", error=dict(_INVALID_RECT_ERROR)
+        )
+
+    start_time = time.monotonic()
+    url_before = browser.page.url
+
+    try:
+        await browser.page.mouse.click(*center)
+        if _can_insert_text(text, delay_ms, fast):
+            await browser.page.keyboard.insert_text(text)
+        else:
+            await browser.page.keyboard.type(text, delay=delay_ms)
+        success = True
+    except Exception as e:
+        success = False
+        error_msg = str(e)
+
+    duration_ms = int((time.monotonic() - start_time) * 1000)
+    url_changed = url_before != browser.page.url
+
+    # Determine outcome
+    outcome: str | None = None
+    if url_changed:
+        outcome = "navigated"
+    elif success:
+        outcome = "dom_updated"
+    else:
+        outcome = "error"
+
+    _invalidate_last_snapshot(browser)
+    snapshot_after: Snapshot | None = None
+    if take_snapshot:
+        snapshot_after = await snapshot_async(browser)
+
+    return ActionResult(
+        success=success,
+        duration_ms=duration_ms,
+        outcome=outcome,
+        url_changed=url_changed,
+        snapshot_after=snapshot_after,
+        error=None if success else {"code": "type_failed", "reason": error_msg},
+    )
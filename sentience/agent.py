@@ -147,15 +147,15 @@ class SentienceAgent(BaseAgent):
         """Get bounding box for an element from snapshot."""
         if element_id is None:
             return None
-        for el in snap.elements:
-            if el.id == element_id:
-                return {
-                    "x": el.bbox.x,
-                    "y": el.bbox.y,
-                    "width": el.bbox.width,
-                    "height": el.bbox.height,
-                }
-        return None
+        el = snap.by_id.get(element_id)
+        if el is None:
+            return None
+        return {
+            "x": el.bbox.x,
+            "y": el.bbox.y,
+            "width": el.bbox.width,
+            "height": el.bbox.height,
+        }
 
     def act(  # noqa: C901
         self,
@@ -716,15 +716,15 @@ class SentienceAgentAsync(BaseAgentAsync):
         """Get bounding box for an element from snapshot."""
         if element_id is None:
             return None
-        for el in snap.elements:
-            if el.id == element_id:
-                return {
-                    "x": el.bbox.x,
-                    "y": el.bbox.y,
-                    "width": el.bbox.width,
-                    "height": el.bbox.height,
-                }
-        return None
+        el = snap.by_id.get(element_id)
+        if el is None:
+            return None
+        return {
+            "x": el.bbox.x,
+            "y": el.bbox.y,
+            "width": el.bbox.width,
+            "height": el.bbox.height,
+        }
 
     async def act(  # noqa: C901
         self,
@@ -27,7 +27,9 @@ from sentience.actions import (
     click_async,
     click_rect_async,
     press_async,
+    run_plan_async,
     scroll_to_async,
+    type_at_async,
     type_text_async,
 )
 
@@ -38,7 +40,7 @@ from sentience.base_agent import BaseAgentAsync
 
 # ========== Browser ==========
 # Re-export AsyncSentienceBrowser from browser.py (moved there for better organization)
-from sentience.browser import AsyncSentienceBrowser
+from sentience.browser import AsyncSentienceBrowser, AsyncSentienceBrowserPool
 
 # Re-export async expect functions from expect.py
 from sentience.expect import ExpectationAsync, expect_async
@@ -76,6 +78,7 @@ from sentience.wait import wait_for_async
 __all__ = [
     # Browser
     "AsyncSentienceBrowser",  # Re-exported from browser.py
+    "AsyncSentienceBrowserPool",  # Re-exported from browser.py
     # Snapshot (Phase 1)
     "snapshot_async",  # Re-exported from snapshot.py
     # Actions (Phase 1)
@@ -84,6 +87,8 @@ __all__ = [
     "press_async",  # Re-exported from actions.py
     "scroll_to_async",  # Re-exported from actions.py
     "click_rect_async",  # Re-exported from actions.py
+    "type_at_async",  # Re-exported from actions.py
+    "run_plan_async",  # Re-exported from actions.py
     # Phase 2A: Core Utilities
     "wait_for_async",  # Re-exported from wait.py
     "screenshot_async",  # Re-exported from screenshot.py
@@ -22,6 +22,8 @@ Usage with browser-use:
 """
 
 import asyncio
+import json
+import logging
 import time
 from typing import TYPE_CHECKING, Any
 
@@ -29,6 +31,7 @@ from ..constants import SENTIENCE_API_URL
 from ..models import Snapshot, SnapshotOptions
 from ..snapshot import (
     _build_snapshot_payload,
+    _extension_options,
     _merge_api_result_with_local,
     _post_snapshot_to_gateway_async,
 )
@@ -37,6 +40,8 @@ from .exceptions import ExtensionDiagnostics, ExtensionNotLoadedError, SnapshotE
 if TYPE_CHECKING:
     from .protocol import BrowserBackend
 
+logger = logging.getLogger(__name__)
+
 
 def _is_execution_context_destroyed_error(e: Exception) -> bool:
     """
@@ -93,7 +98,8 @@ class CachedSnapshot:
     """
     Snapshot cache with staleness detection.
 
-    Caches snapshots and returns cached version if still fresh.
+    Caches snapshots and returns cached version if still fresh and the page is
+    still on the same URL.
     Useful for reducing redundant snapshot calls in action loops.
 
     Usage:
@@ -150,7 +156,7 @@ class CachedSnapshot:
             Snapshot (cached or fresh)
         """
         # Check if we need to refresh
-        if force_refresh or self._is_stale():
+        if force_refresh or self._is_stale() or await self._url_changed():
             self._cached = await snapshot(
                 self._backend,
                 options or self._options,
@@ -183,6 +189,22 @@ class CachedSnapshot:
 
         return False
 
+    async def _url_changed(self) -> bool:
+        """
+        Check whether the page navigated away from the cached snapshot's URL.
+
+        Re-read on every cache hit (one cheap URL read), so a navigation right
+        after get() is never served from the cache.
+        """
+        if self._cached_url is None:
+            return False
+
+        try:
+            return await self._backend.get_url() != self._cached_url
+        except Exception:
+            # Can't tell (e.g. mid-navigation); take a fresh snapshot
+            return True
+
     @property
     def is_cached(self) -> bool:
         """Check if a cached snapshot exists."""
@@ -259,6 +281,32 @@ async def snapshot(
         return await _snapshot_via_extension(backend, options)
 
 
+_EXTENSION_READY_EXPR = (
+    "typeof window.sentience !== 'undefined' && typeof window.sentience.snapshot === 'function'"
+)
+
+
+def _extension_ready_promise(timeout_ms: int) -> str:
+    """JS that polls for the extension inside the page and resolves true/false by timeout_ms"""
+    return f"""
+    new Promise((resolve) => {{
+        const ready = () => {_EXTENSION_READY_EXPR};
+        if (ready()) return resolve(true);
+        const timer = setInterval(() => {{
+            if (ready()) {{
+                clearInterval(timer);
+                clearTimeout(deadline);
+                resolve(true);
+            }}
+        }}, 25);
+        const deadline = setTimeout(() => {{
+            clearInterval(timer);
+            resolve(false);
+        }}, {int(timeout_ms)});
+    }})
+    """
+
+
 async def _wait_for_extension(
     backend: "BrowserBackend",
     timeout_ms: int = 5000,
@@ -266,6 +314,10 @@ async def _wait_for_extension(
     """
     Wait for Sentience extension to inject window.sentience API.
 
+    The page polls for the API itself, so the common case is a single eval round-trip.
+    If that eval fails (e.g. a navigation destroyed the context), falls back to polling
+    from Python with exponential backoff for the remaining time.
+
     Args:
         backend: BrowserBackend implementation
         timeout_ms: Maximum wait time
@@ -273,23 +325,20 @@ async def _wait_for_extension(
     Raises:
         RuntimeError: If extension not injected within timeout
     """
-    import asyncio
-    import logging
-
-    logger = logging.getLogger("sentience.backends.snapshot")
-
     start = time.monotonic()
     timeout_sec = timeout_ms / 1000.0
-    poll_count = 0
 
     logger.debug(f"Waiting for extension injection (timeout={timeout_ms}ms)...")
 
+    try:
+        if await backend.eval(_extension_ready_promise(timeout_ms)):
+            return
+    except Exception as e:
+        logger.debug(f"In-page extension wait failed, polling instead: {e}")
+
+    delay = 0.01
     while True:
         elapsed = time.monotonic() - start
-        poll_count += 1
-
-        if poll_count % 10 == 0:  # Log every 10 polls (~1 second)
-            logger.debug(f"Extension poll #{poll_count}, elapsed={elapsed*1000:.0f}ms")
 
         if elapsed >= timeout_sec:
             # Gather diagnostics
@@ -317,16 +366,13 @@ async def _wait_for_extension(
 
         # Check if extension is ready
         try:
-            ready = await backend.eval(
-                "typeof window.sentience !== 'undefined' && "
-                "typeof window.sentience.snapshot === 'function'"
-            )
-            if ready:
+            if await backend.eval(_EXTENSION_READY_EXPR):
                 return
         except Exception:
             pass  # Keep polling
 
-        await asyncio.sleep(0.1)
+        await asyncio.sleep(min(delay, max(timeout_sec - elapsed, 0)))
+        delay = min(delay * 2, 0.32)
 
 
 async def _snapshot_via_extension(
@@ -340,13 +386,19 @@ async def _snapshot_via_extension(
     # Build options dict for extension API
     ext_options = _build_extension_options(options)
 
-    # Call extension's snapshot function
+    # Call extension's snapshot function, rendering the overlay (if requested) in the
+    # same round-trip so raw_elements never have to be sent back to the page
     result = await _eval_with_navigation_retry(
         backend,
         f"""
-        (() => {{
+        (async () => {{
             const options = {_json_serialize(ext_options)};
-            return window.sentience.snapshot(options);
+            const snap = await window.sentience.snapshot(options);
+            if ({_json_serialize(bool(options.show_overlay))} && snap && snap.raw_elements
+                    && snap.raw_elements.length && window.sentience.showOverlay) {{
+                window.sentience.showOverlay(snap.raw_elements, null);
+            }}
+            return snap;
         }})()
     """,
     )
@@ -359,21 +411,6 @@ async def _snapshot_via_extension(
             url = None
         raise SnapshotError.from_null_result(url=url)
 
-    # Show overlay if requested
-    if options.show_overlay:
-        raw_elements = result.get("raw_elements", [])
-        if raw_elements:
-            await _eval_with_navigation_retry(
-                backend,
-                f"""
-                (() => {{
-                    if (window.sentience && window.sentience.showOverlay) {{
-                        window.sentience.showOverlay({_json_serialize(raw_elements)}, null);
-                    }}
-                }})()
-            """,
-            )
-
     # Build and return Snapshot
     return Snapshot(**result)
 
@@ -453,31 +490,11 @@ async def _snapshot_via_api(
 
 def _build_extension_options(options: SnapshotOptions) -> dict[str, Any]:
     """Build options dict for extension API call."""
-    ext_options: dict[str, Any] = {}
-
-    # Screenshot config
-    if options.screenshot is not False:
-        if hasattr(options.screenshot, "model_dump"):
-            ext_options["screenshot"] = options.screenshot.model_dump()
-        else:
-            ext_options["screenshot"] = options.screenshot
-
-    # Limit (only if not default)
-    if options.limit != 50:
-        ext_options["limit"] = options.limit
-
-    # Filter
-    if options.filter is not None:
-        if hasattr(options.filter, "model_dump"):
-            ext_options["filter"] = options.filter.model_dump()
-        else:
-            ext_options["filter"] = options.filter
-
-    return ext_options
+    # Shared with SentienceBrowser snapshots; None (all defaults) becomes {} because the
+    # eval embeds the dict as a literal and snapshot(null) would bypass the extension defaults
+    return _extension_options(options) or {}
 
 
 def _json_serialize(obj: Any) -> str:
     """Serialize object to JSON string for embedding in JS."""
-    import json
-
     return json.dumps(obj)
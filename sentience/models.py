@@ -4,10 +4,11 @@ Pydantic models for Sentience SDK - matches spec/snapshot.schema.json
 
 from __future__ import annotations
 
+import asyncio
 from dataclasses import dataclass
 from typing import Any, Literal
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
 
 
 class BBox(BaseModel):
@@ -158,6 +159,23 @@ class Snapshot(BaseModel):
     # Phase 2: Runtime stability/debug info (confidence/reasons/metrics)
     diagnostics: SnapshotDiagnostics | None = None
 
+    # Lazily built id -> element index, tagged with the list it was built from
+    _by_id_cache: tuple[list[Element], int, dict[int, Element]] | None = PrivateAttr(default=None)
+
+    @property
+    def by_id(self) -> dict[int, Element]:
+        """
+        Elements indexed by id for O(1) lookup (first element wins on duplicate ids).
+
+        Built on first access and rebuilt if `elements` is replaced or resized.
+        """
+        elements = self.elements
+        cache = self._by_id_cache
+        if cache is None or cache[0] is not elements or cache[1] != len(elements):
+            cache = (elements, len(elements), {el.id: el for el in reversed(elements)})
+            self._by_id_cache = cache
+        return cache[2]
+
     def save(self, filepath: str) -> None:
         """Save snapshot as JSON file"""
         import json
@@ -595,6 +613,17 @@ class ActionResult(BaseModel):
     error: dict | None = None
     # Optional action metadata (e.g., human-like cursor movement path)
     cursor: dict[str, Any] | None = None
+    # Pending post-action snapshot for async actions called with eager_return=True
+    _snapshot_after_task: asyncio.Future[Snapshot] | None = PrivateAttr(default=None)
+
+    @property
+    def snapshot_after_future(self) -> asyncio.Future[Snapshot] | None:
+        """
+        Future resolving to the post-action snapshot (async actions with eager_return=True).
+
+        Await it before acting on the page again; None when no snapshot is pending.
+        """
+        return self._snapshot_after_task
 
 
 class WaitResult(BaseModel):
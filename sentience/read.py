@@ -2,11 +2,14 @@
 Read page content - supports raw HTML, text, and markdown formats
 """
 
+import logging
 from typing import Literal
 
 from .browser import AsyncSentienceBrowser, SentienceBrowser
 from .models import ReadResult
 
+logger = logging.getLogger(__name__)
+
 
 def read(
     browser: SentienceBrowser,
@@ -74,14 +77,14 @@ def read(
                     "length": len(markdown_content),
                 }
             except ImportError:
-                print(
-                    "Warning: 'markdownify' not installed. Install with 'pip install markdownify' for enhanced markdown. Falling back to extension's markdown."
+                logger.warning(
+                    "'markdownify' not installed. Install with 'pip install markdownify' for enhanced markdown. Falling back to extension's markdown."
                 )
             except MarkdownifyError as e:
-                print(f"Warning: markdownify failed ({e}), falling back to extension's markdown.")
+                logger.warning(f"markdownify failed ({e}), falling back to extension's markdown.")
             except Exception as e:
-                print(
-                    f"Warning: An unexpected error occurred with markdownify ({e}), falling back to extension's markdown."
+                logger.warning(
+                    f"An unexpected error occurred with markdownify ({e}), falling back to extension's markdown."
                 )
 
     # If not enhanced markdown, or fallback, call extension with requested format
@@ -164,14 +167,14 @@ async def read_async(
                     "length": len(markdown_content),
                 }
             except ImportError:
-                print(
-                    "Warning: 'markdownify' not installed. Install with 'pip install markdownify' for enhanced markdown. Falling back to extension's markdown."
+                logger.warning(
+                    "'markdownify' not installed. Install with 'pip install markdownify' for enhanced markdown. Falling back to extension's markdown."
                 )
             except MarkdownifyError as e:
-                print(f"Warning: markdownify failed ({e}), falling back to extension's markdown.")
+                logger.warning(f"markdownify failed ({e}), falling back to extension's markdown.")
             except Exception as e:
-                print(
-                    f"Warning: An unexpected error occurred with markdownify ({e}), falling back to extension's markdown."
+                logger.warning(
+                    f"An unexpected error occurred with markdownify ({e}), falling back to extension's markdown."
                 )
 
     # If not enhanced markdown, or fallback, call extension with requested format
@@ -210,11 +210,7 @@ class Recorder:
             snap = snapshot(self.browser)
 
             # Find the element in the snapshot
-            element = None
-            for el in snap.elements:
-                if el.id == element_id:
-                    element = el
-                    break
+            element = snap.by_id.get(element_id)
 
             if not element:
                 return None
@@ -430,11 +426,7 @@ class RecorderAsync:
             snap = await snapshot_async(self.browser)
 
             # Find the element in the snapshot
-            element = None
-            for el in snap.elements:
-                if el.id == element_id:
-                    element = el
-                    break
+            element = snap.by_id.get(element_id)
 
             if not element:
                 return None
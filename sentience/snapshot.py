@@ -4,9 +4,11 @@ Snapshot functionality - calls window.sentience.snapshot() or server-side API
 
 import asyncio
 import json
+import logging
 import os
 import time
-from typing import Any, Optional
+from collections.abc import Awaitable, Callable
+from typing import TYPE_CHECKING, Any, Optional, TypeVar
 
 import requests
 
@@ -14,7 +16,21 @@ from .browser import AsyncSentienceBrowser, SentienceBrowser
 from .browser_evaluator import BrowserEvaluator
 from .constants import SENTIENCE_API_URL
 from .models import Snapshot, SnapshotOptions
-from .sentience_methods import SentienceMethod
+
+if TYPE_CHECKING:
+    import httpx
+
+logger = logging.getLogger(__name__)
+
+# Optional fast JSON codec for gateway payloads (pip install sentienceapi[fast-json])
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+_T = TypeVar("_T")
 
 # Maximum payload size for API requests (10MB server limit)
 MAX_PAYLOAD_BYTES = 10 * 1024 * 1024
@@ -36,6 +52,20 @@ def _is_execution_context_destroyed_error(e: Exception) -> bool:
     )
 
 
+def _is_extension_not_ready_error(e: Exception) -> bool:
+    """
+    Errors from calling window.sentience before the extension (re)injected it, e.g. after
+    an in-place reload, or while a navigation replaces the document.
+    """
+    msg = str(e).lower()
+    return (
+        _is_execution_context_destroyed_error(e)
+        or "window.sentience" in msg
+        or "sentience is not defined" in msg
+        or "reading 'snapshot'" in msg
+    )
+
+
 async def _page_evaluate_with_nav_retry(
     page: Any,
     expression: str,
@@ -92,6 +122,80 @@ async def _wait_for_function_with_nav_retry(
     raise last_err if last_err else RuntimeError("wait_for_function failed")
 
 
+def _extension_known_ready(browser: Any) -> bool:
+    """Check if window.sentience was already confirmed ready on the page's current URL"""
+    ready_url = getattr(browser, "_extension_ready_for_url", None)
+    return ready_url is not None and ready_url == browser.page.url
+
+
+def _mark_extension_ready(browser: Any) -> None:
+    """Remember that window.sentience is ready on the page's current URL"""
+    if hasattr(browser, "_extension_ready_for_url"):
+        browser._extension_ready_for_url = browser.page.url
+
+
+def _snapshot_cache_token(browser: Any) -> tuple[int, str] | None:
+    """Record the cache generation and URL when a snapshot starts (see _remember_snapshot)"""
+    if not hasattr(browser, "_snapshot_generation") or browser.page is None:
+        return None
+    return browser._snapshot_generation, browser.page.url
+
+
+def _remember_snapshot(browser: Any, snap: Snapshot, token: tuple[int, str] | None) -> None:
+    """
+    Keep the latest snapshot on the browser so actions (e.g. click) can reuse it.
+
+    Skipped if the cache was invalidated while the snapshot ran, e.g. an eager_return
+    snapshot task finishing after a later action. The snapshot is keyed on the URL
+    it started on.
+    """
+    if token is not None and browser._snapshot_generation == token[0]:
+        browser._last_snapshot = snap
+        browser._last_snapshot_url = token[1]
+
+
+def _call_with_extension_ready(
+    browser: Any, wait: Callable[[], None], call: Callable[[], _T]
+) -> _T:
+    """
+    Run call() once window.sentience is ready.
+
+    The readiness wait is skipped when it already succeeded on the current URL
+    (in goto() or a previous snapshot). If that fast path fails, e.g. because the
+    page was reloaded in place, fall back to waiting and retry once.
+    """
+    if _extension_known_ready(browser):
+        try:
+            return call()
+        except Exception as e:
+            if not _is_extension_not_ready_error(e):
+                raise
+            logger.debug(f"Extension not ready on fast path, waiting and retrying: {e}")
+    wait()
+    result = call()
+    _mark_extension_ready(browser)
+    return result
+
+
+async def _call_with_extension_ready_async(
+    browser: Any,
+    wait: Callable[[], Awaitable[None]],
+    call: Callable[[], Awaitable[_T]],
+) -> _T:
+    """Async version of _call_with_extension_ready()"""
+    if _extension_known_ready(browser):
+        try:
+            return await call()
+        except Exception as e:
+            if not _is_extension_not_ready_error(e):
+                raise
+            logger.debug(f"Extension not ready on fast path, waiting and retrying: {e}")
+    await wait()
+    result = await call()
+    _mark_extension_ready(browser)
+    return result
+
+
 def _build_snapshot_payload(
     raw_result: dict[str, Any],
     options: SnapshotOptions,
@@ -121,13 +225,94 @@ def _build_snapshot_payload(
     }
 
 
-def _validate_payload_size(payload_json: str) -> None:
+def _encode_payload(payload: dict[str, Any]) -> bytes:
+    """
+    Serialize gateway payload to the exact request body bytes.
+
+    Encoding once lets the size check and the HTTP client share one buffer.
+    Uses orjson when installed, which produces bytes directly.
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(payload)
+    return json.dumps(payload).encode("utf-8")
+
+
+def _loads(data: str | bytes) -> Any:
+    """Parse JSON text, using orjson when installed"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+# Serializes the snapshot inside the page so it crosses CDP as a single string,
+# instead of going through Playwright's per-value object graph serialization.
+# A null options arg means "extension defaults" and calls snapshot() with no args.
+_SNAPSHOT_JSON_JS = """
+async (options) => JSON.stringify(
+    await (options ? window.sentience.snapshot(options) : window.sentience.snapshot())
+)
+"""
+
+
+def _extension_options(options: SnapshotOptions) -> dict[str, Any] | None:
+    """
+    Build the window.sentience.snapshot() options dict (excludes save_trace/trace_path etc.).
+
+    Returns None when every option the extension reads is at its default, so the common
+    snapshot(browser) call sends no options across CDP at all.
+    """
+    if options.screenshot is False and options.limit == 50 and options.filter is None:
+        return None
+
+    ext_options: dict[str, Any] = {}
+    if options.screenshot is not False:
+        # Serialize ScreenshotConfig to dict if it's a Pydantic model
+        if hasattr(options.screenshot, "model_dump"):
+            ext_options["screenshot"] = options.screenshot.model_dump()
+        else:
+            ext_options["screenshot"] = options.screenshot
+    if options.limit != 50:
+        ext_options["limit"] = options.limit
+    if options.filter is not None:
+        ext_options["filter"] = (
+            options.filter.model_dump() if hasattr(options.filter, "model_dump") else options.filter
+        )
+    return ext_options
+
+
+def _parse_snapshot_result(result: Any) -> dict[str, Any]:
+    """Decode a _SNAPSHOT_JSON_JS result (PageProtocol stand-ins may return the dict directly)"""
+    if isinstance(result, (str, bytes)):
+        return _loads(result)
+    return result
+
+
+def _evaluate_snapshot(page: Any, options: dict[str, Any] | None) -> dict[str, Any]:
+    """Call window.sentience.snapshot(options) and parse the JSON-encoded result"""
+    return _parse_snapshot_result(page.evaluate(_SNAPSHOT_JSON_JS, options))
+
+
+async def _evaluate_snapshot_async(page: Any, options: dict[str, Any] | None) -> dict[str, Any]:
+    """Call window.sentience.snapshot(options) and parse the JSON-encoded result (async)"""
+    return _parse_snapshot_result(
+        await _page_evaluate_with_nav_retry(page, _SNAPSHOT_JSON_JS, options)
+    )
+
+
+def _decode_response(response: Any) -> dict[str, Any]:
+    """Parse a gateway JSON response body (requests or httpx), using orjson when installed"""
+    if ORJSON_AVAILABLE:
+        return _loads(response.content)
+    return response.json()
+
+
+def _validate_payload_size(payload_body: bytes) -> None:
     """
     Validate payload size before sending to gateway.
 
     Raises ValueError if payload exceeds server limit.
     """
-    payload_size = len(payload_json.encode("utf-8"))
+    payload_size = len(payload_body)
     if payload_size > MAX_PAYLOAD_BYTES:
         raise ValueError(
             f"Payload size ({payload_size / 1024 / 1024:.2f}MB) exceeds server limit "
@@ -140,59 +325,84 @@ def _post_snapshot_to_gateway_sync(
     payload: dict[str, Any],
     api_key: str,
     api_url: str = SENTIENCE_API_URL,
+    session: requests.Session | None = None,
 ) -> dict[str, Any]:
     """
     Post snapshot payload to gateway (synchronous).
 
-    Used by sync snapshot() function.
+    Used by sync snapshot() function. Pass a session to reuse pooled connections.
     """
-    payload_json = json.dumps(payload)
-    _validate_payload_size(payload_json)
+    payload_body = _encode_payload(payload)
+    _validate_payload_size(payload_body)
 
     headers = {
         "Authorization": f"Bearer {api_key}",
         "Content-Type": "application/json",
     }
 
-    response = requests.post(
+    response = (session or requests).post(
         f"{api_url}/v1/snapshot",
-        data=payload_json,
+        data=payload_body,
         headers=headers,
         timeout=30,
     )
     response.raise_for_status()
-    return response.json()
+    return _decode_response(response)
 
 
 async def _post_snapshot_to_gateway_async(
     payload: dict[str, Any],
     api_key: str,
     api_url: str = SENTIENCE_API_URL,
+    client: "httpx.AsyncClient | None" = None,
 ) -> dict[str, Any]:
     """
     Post snapshot payload to gateway (asynchronous).
 
     Used by async backend snapshot() function.
     """
+    payload_body = _encode_payload(payload)
+    _validate_payload_size(payload_body)
+    return await _post_snapshot_body_async(payload_body, api_key, api_url, client)
+
+
+async def _post_snapshot_body_async(
+    payload_body: bytes,
+    api_key: str,
+    api_url: str = SENTIENCE_API_URL,
+    client: "httpx.AsyncClient | None" = None,
+) -> dict[str, Any]:
+    """
+    Post an already encoded and size-checked payload to gateway (asynchronous).
+
+    Pass a client to reuse pooled connections; otherwise a short-lived client
+    is created for this request.
+    """
     # Lazy import httpx - only needed for async API calls
     import httpx
 
-    payload_json = json.dumps(payload)
-    _validate_payload_size(payload_json)
-
     headers = {
         "Authorization": f"Bearer {api_key}",
         "Content-Type": "application/json",
     }
 
+    if client is not None:
+        response = await client.post(
+            f"{api_url}/v1/snapshot",
+            content=payload_body,
+            headers=headers,
+        )
+        response.raise_for_status()
+        return _decode_response(response)
+
     async with httpx.AsyncClient(timeout=30.0) as client:
         response = await client.post(
             f"{api_url}/v1/snapshot",
-            content=payload_json,
+            content=payload_body,
             headers=headers,
         )
         response.raise_for_status()
-        return response.json()
+        return _decode_response(response)
 
 
 def _merge_api_result_with_local(
@@ -240,7 +450,7 @@ def _save_trace_to_file(raw_elements: list[dict[str, Any]], trace_path: str | No
     with open(filename, "w") as f:
         json.dump(raw_elements, f, indent=2)
 
-    print(f"[SDK] Trace saved to: {filename}")
+    logger.info(f"Trace saved to: {filename}")
 
 
 def snapshot(
@@ -273,6 +483,8 @@ def snapshot(
     if options is None:
         options = SnapshotOptions()
 
+    cache_token = _snapshot_cache_token(browser)
+
     # Resolve API key: options.sentience_api_key takes precedence, then browser.api_key
     # This allows browser-use users to pass api_key via options without SentienceBrowser
     effective_api_key = options.sentience_api_key or browser.api_key
@@ -284,10 +496,13 @@ def snapshot(
 
     if should_use_api and effective_api_key:
         # Use server-side API (Pro/Enterprise tier)
-        return _snapshot_via_api(browser, options, effective_api_key)
+        snap = _snapshot_via_api(browser, options, effective_api_key)
     else:
         # Use local extension (Free tier)
-        return _snapshot_via_extension(browser, options)
+        snap = _snapshot_via_extension(browser, options)
+
+    _remember_snapshot(browser, snap, cache_token)
+    return snap
 
 
 def _snapshot_via_extension(
@@ -298,34 +513,17 @@ def _snapshot_via_extension(
     if not browser.page:
         raise RuntimeError("Browser not started. Call browser.start() first.")
 
+    # Build options dict for extension API (None when all defaults)
+    ext_options = _extension_options(options)
+
     # CRITICAL: Wait for extension injection to complete (CSP-resistant architecture)
     # The new architecture loads injected_api.js asynchronously, so window.sentience
-    # may not be immediately available after page load
-    BrowserEvaluator.wait_for_extension(browser.page, timeout_ms=5000)
-
-    # Build options dict for extension API (exclude save_trace/trace_path)
-    ext_options: dict[str, Any] = {}
-    if options.screenshot is not False:
-        # Serialize ScreenshotConfig to dict if it's a Pydantic model
-        if hasattr(options.screenshot, "model_dump"):
-            ext_options["screenshot"] = options.screenshot.model_dump()
-        else:
-            ext_options["screenshot"] = options.screenshot
-    if options.limit != 50:
-        ext_options["limit"] = options.limit
-    if options.filter is not None:
-        ext_options["filter"] = (
-            options.filter.model_dump() if hasattr(options.filter, "model_dump") else options.filter
-        )
-
-    # Call extension API
-    result = browser.page.evaluate(
-        """
-        (options) => {
-            return window.sentience.snapshot(options);
-        }
-        """,
-        ext_options,
+    # may not be immediately available after page load. The wait is skipped when
+    # readiness was already confirmed on this URL.
+    result = _call_with_extension_ready(
+        browser,
+        lambda: BrowserEvaluator.wait_for_extension(browser.page, timeout_ms=5000),
+        lambda: _evaluate_snapshot(browser.page, ext_options),
     )
 
     # Save trace if requested
@@ -390,24 +588,18 @@ def _snapshot_via_api(
     # Use browser.api_url if set, otherwise default
     api_url = browser.api_url or SENTIENCE_API_URL
 
+    # Step 1: Get raw data from local extension (always happens locally).
+    # limit/filter are passed too, to keep raw_elements payload bounded. Without this,
+    # large pages (e.g. Amazon) can exceed gateway request size limits (HTTP 413).
+    raw_options = _extension_options(options)
+
     # CRITICAL: Wait for extension injection to complete (CSP-resistant architecture)
     # Even for API mode, we need the extension to collect raw data locally
-    BrowserEvaluator.wait_for_extension(browser.page, timeout_ms=5000)
-
-    # Step 1: Get raw data from local extension (always happens locally)
-    raw_options: dict[str, Any] = {}
-    if options.screenshot is not False:
-        raw_options["screenshot"] = options.screenshot
-    # Important: also pass limit/filter to extension to keep raw_elements payload bounded.
-    # Without this, large pages (e.g. Amazon) can exceed gateway request size limits (HTTP 413).
-    if options.limit != 50:
-        raw_options["limit"] = options.limit
-    if options.filter is not None:
-        raw_options["filter"] = (
-            options.filter.model_dump() if hasattr(options.filter, "model_dump") else options.filter
-        )
-
-    raw_result = BrowserEvaluator.invoke(browser.page, SentienceMethod.SNAPSHOT, **raw_options)
+    raw_result = _call_with_extension_ready(
+        browser,
+        lambda: BrowserEvaluator.wait_for_extension(browser.page, timeout_ms=5000),
+        lambda: _evaluate_snapshot(browser.page, raw_options),
+    )
 
     # Save trace if requested (save raw data before API processing)
     if options.save_trace:
@@ -419,12 +611,16 @@ def _snapshot_via_api(
     payload = _build_snapshot_payload(raw_result, options)
 
     try:
-        api_result = _post_snapshot_to_gateway_sync(payload, api_key, api_url)
+        api_result = _post_snapshot_to_gateway_sync(
+            payload, api_key, api_url, session=browser._get_http_session()
+        )
 
         # Merge API result with local data (screenshot, etc.)
         snapshot_data = _merge_api_result_with_local(api_result, raw_result)
 
-        # Create snapshot object
+        # Create snapshot object. Keep validating even for trusted gateway data:
+        # pydantic-core validation is several times faster than Snapshot.model_construct,
+        # which would also have to rebuild every nested Element/BBox by hand in Python.
         snapshot_obj = Snapshot(**snapshot_data)
 
         # Show visual overlay if requested (use API-ranked elements)
@@ -502,6 +698,8 @@ async def snapshot_async(
     if options is None:
         options = SnapshotOptions()
 
+    cache_token = _snapshot_cache_token(browser)
+
     # Resolve API key: options.sentience_api_key takes precedence, then browser.api_key
     # This allows browser-use users to pass api_key via options without SentienceBrowser
     effective_api_key = options.sentience_api_key or browser.api_key
@@ -513,10 +711,13 @@ async def snapshot_async(
 
     if should_use_api and effective_api_key:
         # Use server-side API (Pro/Enterprise tier)
-        return await _snapshot_via_api_async(browser, options, effective_api_key)
+        snap = await _snapshot_via_api_async(browser, options, effective_api_key)
     else:
         # Use local extension (Free tier)
-        return await _snapshot_via_extension_async(browser, options)
+        snap = await _snapshot_via_extension_async(browser, options)
+
+    _remember_snapshot(browser, snap, cache_token)
+    return snap
 
 
 async def _snapshot_via_extension_async(
@@ -528,57 +729,42 @@ async def _snapshot_via_extension_async(
         raise RuntimeError("Browser not started. Call await browser.start() first.")
 
     # Wait for extension injection to complete
-    try:
-        await _wait_for_function_with_nav_retry(
-            browser.page,
-            "typeof window.sentience !== 'undefined'",
-            timeout_ms=5000,
-        )
-    except Exception as e:
+    async def wait_for_extension() -> None:
         try:
-            diag = await _page_evaluate_with_nav_retry(
+            await _wait_for_function_with_nav_retry(
                 browser.page,
-                """() => ({
-                    sentience_defined: typeof window.sentience !== 'undefined',
-                    extension_id: document.documentElement.dataset.sentienceExtensionId || 'not set',
-                    url: window.location.href
-                })""",
+                "typeof window.sentience !== 'undefined'",
+                timeout_ms=5000,
             )
-        except Exception:
-            diag = {"error": "Could not gather diagnostics"}
+        except Exception as e:
+            try:
+                diag = await _page_evaluate_with_nav_retry(
+                    browser.page,
+                    """() => ({
+                        sentience_defined: typeof window.sentience !== 'undefined',
+                        extension_id: document.documentElement.dataset.sentienceExtensionId || 'not set',
+                        url: window.location.href
+                    })""",
+                )
+            except Exception:
+                diag = {"error": "Could not gather diagnostics"}
 
-        raise RuntimeError(
-            f"Sentience extension failed to inject window.sentience API. "
-            f"Is the extension loaded? Diagnostics: {diag}"
-        ) from e
+            raise RuntimeError(
+                f"Sentience extension failed to inject window.sentience API. "
+                f"Is the extension loaded? Diagnostics: {diag}"
+            ) from e
 
-    # Build options dict for extension API
-    ext_options: dict[str, Any] = {}
-    if options.screenshot is not False:
-        # Serialize ScreenshotConfig to dict if it's a Pydantic model
-        if hasattr(options.screenshot, "model_dump"):
-            ext_options["screenshot"] = options.screenshot.model_dump()
-        else:
-            ext_options["screenshot"] = options.screenshot
-    if options.limit != 50:
-        ext_options["limit"] = options.limit
-    if options.filter is not None:
-        ext_options["filter"] = (
-            options.filter.model_dump() if hasattr(options.filter, "model_dump") else options.filter
-        )
+    # Build options dict for extension API (None when all defaults)
+    ext_options = _extension_options(options)
 
     # Call extension API
-    result = await _page_evaluate_with_nav_retry(
-        browser.page,
-        """
-        (options) => {
-            return window.sentience.snapshot(options);
-        }
-        """,
-        ext_options,
+    result = await _call_with_extension_ready_async(
+        browser,
+        wait_for_extension,
+        lambda: _evaluate_snapshot_async(browser.page, ext_options),
     )
     if result.get("error"):
-        print(f"      Snapshot error: {result.get('error')}")
+        logger.warning(f"Snapshot error: {result.get('error')}")
 
     # Save trace if requested
     if options.save_trace:
@@ -653,44 +839,28 @@ async def _snapshot_via_api_async(
     api_url = browser.api_url or SENTIENCE_API_URL
 
     # Wait for extension injection
-    try:
-        await _wait_for_function_with_nav_retry(
-            browser.page,
-            "typeof window.sentience !== 'undefined'",
-            timeout_ms=5000,
-        )
-    except Exception as e:
-        raise RuntimeError(
-            "Sentience extension failed to inject. Cannot collect raw data for API processing."
-        ) from e
-
-    # Step 1: Get raw data from local extension (including screenshot)
-    raw_options: dict[str, Any] = {}
-    screenshot_requested = False
-    if options.screenshot is not False:
-        screenshot_requested = True
-        # Serialize ScreenshotConfig to dict if it's a Pydantic model
-        if hasattr(options.screenshot, "model_dump"):
-            raw_options["screenshot"] = options.screenshot.model_dump()
-        else:
-            raw_options["screenshot"] = options.screenshot
-    # Important: also pass limit/filter to extension to keep raw_elements payload bounded.
-    # Without this, large pages (e.g. Amazon) can exceed gateway request size limits (HTTP 413).
-    if options.limit != 50:
-        raw_options["limit"] = options.limit
-    if options.filter is not None:
-        raw_options["filter"] = (
-            options.filter.model_dump() if hasattr(options.filter, "model_dump") else options.filter
-        )
-
-    raw_result = await _page_evaluate_with_nav_retry(
-        browser.page,
-        """
-        (options) => {
-            return window.sentience.snapshot(options);
-        }
-        """,
-        raw_options,
+    async def wait_for_extension() -> None:
+        try:
+            await _wait_for_function_with_nav_retry(
+                browser.page,
+                "typeof window.sentience !== 'undefined'",
+                timeout_ms=5000,
+            )
+        except Exception as e:
+            raise RuntimeError(
+                "Sentience extension failed to inject. Cannot collect raw data for API processing."
+            ) from e
+
+    # Step 1: Get raw data from local extension (including screenshot).
+    # limit/filter are passed too, to keep raw_elements payload bounded. Without this,
+    # large pages (e.g. Amazon) can exceed gateway request size limits (HTTP 413).
+    screenshot_requested = options.screenshot is not False
+    raw_options = _extension_options(options)
+
+    raw_result = await _call_with_extension_ready_async(
+        browser,
+        wait_for_extension,
+        lambda: _evaluate_snapshot_async(browser.page, raw_options),
     )
 
     # Extract screenshot from raw result (extension captures it, but API doesn't return it)
@@ -720,32 +890,13 @@ async def _snapshot_via_api_async(
     }
 
     # Check payload size
-    payload_json = json.dumps(payload)
-    payload_size = len(payload_json.encode("utf-8"))
-    if payload_size > MAX_PAYLOAD_BYTES:
-        raise ValueError(
-            f"Payload size ({payload_size / 1024 / 1024:.2f}MB) exceeds server limit "
-            f"({MAX_PAYLOAD_BYTES / 1024 / 1024:.0f}MB). "
-            f"Try reducing the number of elements on the page or filtering elements."
-        )
-
-    headers = {
-        "Authorization": f"Bearer {api_key}",
-        "Content-Type": "application/json",
-    }
+    payload_body = _encode_payload(payload)
+    _validate_payload_size(payload_body)
 
     try:
-        # Lazy import httpx - only needed for async API calls
-        import httpx
-
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.post(
-                f"{api_url}/v1/snapshot",
-                content=payload_json,
-                headers=headers,
-            )
-            response.raise_for_status()
-            api_result = response.json()
+        api_result = await _post_snapshot_body_async(
+            payload_body, api_key, api_url, client=browser._get_http_client()
+        )
 
         # Extract screenshot format from data URL if not provided
         if screenshot_data_url and not screenshot_format:
@@ -766,7 +917,9 @@ async def _snapshot_via_api_async(
             "error": api_result.get("error"),
         }
 
-        # Create snapshot object
+        # Create snapshot object. Keep validating even for trusted gateway data:
+        # pydantic-core validation is several times faster than Snapshot.model_construct,
+        # which would also have to rebuild every nested Element/BBox by hand in Python.
         snapshot_obj = Snapshot(**snapshot_data)
 
         # Show visual overlay if requested
@@ -74,7 +74,8 @@ class SnapshotDiff:
                 result.append(Element(**el_dict))
             return result
 
-        # Build lookup maps by element ID
+        # Build lookup maps by element ID (last element wins on duplicate ids, unlike
+        # Snapshot.by_id, so diff results stay as they were for such snapshots)
         current_by_id = {el.id: el for el in current.elements}
         previous_by_id = {el.id: el for el in previous.elements}
 
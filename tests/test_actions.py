@@ -257,3 +257,264 @@ def test_type_text_with_delay():
             assert result.success is True
             # Duration should be longer due to delays
             assert result.duration_ms >= 50  # At least 5 chars * 10ms
+
+
+def _mock_browser_with_last_snapshot(url="https://example.com/"):
+    """Unstarted SentienceBrowser with a mock page and a cached snapshot on `url`"""
+    from unittest.mock import MagicMock
+
+    from sentience.models import Element, Snapshot, VisualCues
+
+    browser = SentienceBrowser()
+    browser.page = MagicMock()
+    browser.page.url = url
+    browser._last_snapshot = Snapshot(
+        status="success",
+        url=url,
+        elements=[
+            Element(
+                id=7,
+                role="button",
+                importance=100,
+                bbox=BBox(x=10, y=20, width=100, height=40),
+                visual_cues=VisualCues(is_primary=True, is_clickable=True),
+            )
+        ],
+    )
+    browser._last_snapshot_url = url
+    return browser
+
+
+def test_click_takes_fresh_snapshot_by_default():
+    """Test click ignores the cached snapshot unless reuse is requested"""
+    from unittest.mock import patch
+
+    browser = _mock_browser_with_last_snapshot()
+    cached = browser._last_snapshot
+
+    with patch("sentience.actions.snapshot", return_value=cached) as mock_snapshot:
+        click(browser, 7)
+
+    mock_snapshot.assert_called_once_with(browser)
+
+
+def test_click_reuses_last_snapshot_on_same_url():
+    """Test click uses the cached snapshot instead of taking a new one"""
+    from unittest.mock import patch
+
+    browser = _mock_browser_with_last_snapshot()
+
+    with patch("sentience.actions.snapshot") as mock_snapshot:
+        result = click(browser, 7, reuse_snapshot=True)
+
+    mock_snapshot.assert_not_called()
+    browser.page.mouse.click.assert_called_once_with(60, 40)
+    assert result.success is True
+    # The click may have changed the page, so the cache is dropped
+    assert browser._last_snapshot is None
+
+
+def test_click_takes_fresh_snapshot_after_url_change():
+    """Test click ignores a cached snapshot from a different URL"""
+    from unittest.mock import patch
+
+    browser = _mock_browser_with_last_snapshot()
+    cached = browser._last_snapshot
+    browser.page.url = "https://example.com/other"
+
+    with patch("sentience.actions.snapshot", return_value=cached) as mock_snapshot:
+        click(browser, 7, reuse_snapshot=True)
+
+    mock_snapshot.assert_called_once_with(browser)
+
+
+def test_click_waits_for_dom_change_instead_of_fixed_timeout():
+    """Test click waits on the mutation counter rather than a fixed 500ms sleep"""
+    from unittest.mock import patch
+
+    browser = _mock_browser_with_last_snapshot()
+    browser.page.evaluate.return_value = 3
+
+    with patch("sentience.actions.snapshot"):
+        click(browser, 7)
+
+    browser.page.wait_for_timeout.assert_not_called()
+    browser.page.wait_for_function.assert_called_once()
+    assert browser.page.wait_for_function.call_args.kwargs["arg"] == 3
+    assert browser.page.wait_for_function.call_args.kwargs["timeout"] == 500
+
+
+def test_click_falls_back_to_fixed_wait_without_mutation_counter():
+    """Test click keeps the fixed wait if the mutation counter can't be read"""
+    from unittest.mock import patch
+
+    browser = _mock_browser_with_last_snapshot()
+    browser.page.evaluate.side_effect = Exception("context destroyed")
+
+    with patch("sentience.actions.snapshot"):
+        click(browser, 7)
+
+    browser.page.wait_for_timeout.assert_called_once_with(500)
+    browser.page.wait_for_function.assert_not_called()
+
+
+@pytest.mark.parametrize(
+    "action",
+    [
+        lambda b: press(b, "Enter"),
+        lambda b: click_rect(b, {"x": 10, "y": 20, "w": 100, "h": 40}, highlight=False),
+        lambda b: click_rect(b, {"x": 10, "y": 20, "w": 100, "h": 40}),
+    ],
+    ids=["press", "click_rect", "click_rect_highlight"],
+)
+def test_press_and_click_rect_wait_for_dom_change(action):
+    """Test press/click_rect wait on the mutation counter rather than a fixed 500ms sleep"""
+    browser = _mock_browser_with_last_snapshot()
+    browser.page.evaluate.return_value = 5
+
+    result = action(browser)
+
+    assert result.success is True
+    browser.page.wait_for_timeout.assert_not_called()
+    assert browser.page.wait_for_function.call_args.kwargs == {"arg": 5, "timeout": 500}
+
+
+@pytest.mark.parametrize(
+    "text,delay_ms,fast,inserted",
+    [
+        ("hello world", 0, True, True),
+        ("hello world", 0, False, False),
+        ("line\n", 0, True, False),
+        ("hello", 10, True, False),
+    ],
+)
+def test_type_text_inserts_plain_text_in_one_call(text, delay_ms, fast, inserted):
+    """Test fast plain-text typing uses insert_text; the default keeps per-key events"""
+    browser = _mock_browser_with_last_snapshot()
+    browser.page.evaluate.return_value = True
+
+    result = type_text(browser, 7, text, delay_ms=delay_ms, fast=fast)
+
+    assert result.success is True
+    if inserted:
+        browser.page.keyboard.insert_text.assert_called_once_with(text)
+        browser.page.keyboard.type.assert_not_called()
+    else:
+        browser.page.keyboard.type.assert_called_once_with(text, delay=delay_ms)
+        browser.page.keyboard.insert_text.assert_not_called()
+
+
+def test_highlight_renderer_installed_once_per_document():
+    """Test highlight ships the overlay JS only when the page doesn't have it yet"""
+    from sentience.actions import _HIGHLIGHT_CALL_JS, _HIGHLIGHT_INSTALL_JS, _highlight_rect
+
+    browser = _mock_browser_with_last_snapshot()
+    rect = {"x": 1, "y": 2, "w": 3, "h": 4}
+
+    browser.page.evaluate.side_effect = [False, None]
+    _highlight_rect(browser, rect)
+    scripts = [c.args[0] for c in browser.page.evaluate.call_args_list]
+    assert scripts == [_HIGHLIGHT_CALL_JS, _HIGHLIGHT_INSTALL_JS]
+
+    browser.page.evaluate.reset_mock(side_effect=True)
+    browser.page.evaluate.return_value = True
+    _highlight_rect(browser, rect)
+    browser.page.evaluate.assert_called_once()
+    assert browser.page.evaluate.call_args.args[0] == _HIGHLIGHT_CALL_JS
+
+
+def test_run_plan_takes_one_trailing_snapshot():
+    """Test run_plan runs steps without per-step snapshots and snapshots once at the end"""
+    from unittest.mock import patch
+
+    from sentience import run_plan
+
+    browser = _mock_browser_with_last_snapshot()
+    browser.page.evaluate.return_value = True
+    final = browser._last_snapshot
+
+    with patch("sentience.actions.snapshot", return_value=final) as mock_snapshot:
+        result = run_plan(browser, [("type", 7, "hello"), ("press", "Enter")])
+
+    mock_snapshot.assert_called_once_with(browser)
+    assert result.success is True
+    assert result.snapshot_after is final
+    browser.page.keyboard.type.assert_called_once_with("hello", delay=0)
+    browser.page.keyboard.press.assert_called_once_with("Enter")
+
+
+def test_run_plan_shares_one_snapshot_across_click_steps():
+    """Test a click+type+press plan snapshots once before the steps and once at the end"""
+    from unittest.mock import patch
+
+    from sentience import run_plan
+
+    browser = _mock_browser_with_last_snapshot()
+    browser.page.evaluate.return_value = True
+    snap = browser._last_snapshot
+    # Nothing cached: the first click step takes the plan's only leading snapshot
+    browser._last_snapshot = None
+
+    steps = [("click", 7), ("type", 7, "hello"), ("click", 7), ("press", "Enter")]
+    with patch("sentience.actions.snapshot", return_value=snap) as mock_snapshot:
+        result = run_plan(browser, steps)
+
+    assert result.success is True
+    assert mock_snapshot.call_count == 2
+    assert browser.page.mouse.click.call_count == 2
+
+    # The caller's latest snapshot on this page is reused, so only the final one is taken
+    browser._last_snapshot = snap
+    browser._last_snapshot_url = browser.page.url
+    with patch("sentience.actions.snapshot", return_value=snap) as mock_snapshot:
+        run_plan(browser, steps)
+
+    mock_snapshot.assert_called_once_with(browser)
+
+
+def test_run_plan_stops_at_failed_step():
+    """Test run_plan reports the index of the first failed step and skips the rest"""
+    from sentience import run_plan
+
+    browser = _mock_browser_with_last_snapshot()
+    browser.page.evaluate.return_value = False  # focus fails
+
+    result = run_plan(browser, [("type", 99, "x"), ("press", "Enter")], final_snapshot=False)
+
+    assert result.success is False
+    assert result.error == {"code": "focus_failed", "reason": "Element not found", "step": 0}
+    browser.page.keyboard.press.assert_not_called()
+
+
+def test_type_at_focuses_by_bbox_without_registry_lookup():
+    """Test type_at clicks the bbox center and types without evaluating in the page"""
+    from sentience import type_at
+
+    browser = _mock_browser_with_last_snapshot()
+
+    result = type_at(browser, BBox(x=10, y=20, width=100, height=40), "hello", fast=True)
+
+    assert result.success is True
+    browser.page.mouse.click.assert_called_once_with(60, 40)
+    browser.page.keyboard.insert_text.assert_called_once_with("hello")
+    browser.page.evaluate.assert_not_called()
+    browser.page.wait_for_function.assert_not_called()
+
+    invalid = type_at(browser, {"x": 0, "y": 0, "w": 0, "h": 10}, "x")
+    assert invalid.success is False
+    assert invalid.error["code"] == "invalid_rect"
+
+
+def test_type_at_reports_click_failure():
+    """Test type_at returns a failed ActionResult instead of raising when the click fails"""
+    from sentience import type_at
+
+    browser = _mock_browser_with_last_snapshot()
+    browser.page.mouse.click.side_effect = Exception("Target closed")
+
+    result = type_at(browser, {"x": 0, "y": 0, "w": 10, "h": 10}, "hello")
+
+    assert result.success is False
+    assert result.outcome == "error"
+    assert result.error == {"code": "type_failed", "reason": "Target closed"}
+    browser.page.keyboard.type.assert_not_called()
@@ -7,6 +7,7 @@ from playwright.async_api import async_playwright
 
 from sentience.async_api import (
     AsyncSentienceBrowser,
+    AsyncSentienceBrowserPool,
     BaseAgentAsync,
     ExpectationAsync,
     InspectorAsync,
@@ -675,3 +676,222 @@ async def test_inspect_async_function():
         inspector = inspect_async(browser)
         assert isinstance(inspector, InspectorAsync)
         assert inspector.browser == browser
+
+
+@pytest.mark.asyncio
+async def test_async_inject_storage_state_origins_use_separate_pages():
+    """Test localStorage for each origin is injected on its own page, then closed"""
+    from unittest.mock import AsyncMock, MagicMock
+
+    browser = AsyncSentienceBrowser()
+    browser.page = MagicMock()
+    browser.page.goto = AsyncMock()
+    browser.context = MagicMock()
+    browser.context.add_cookies = AsyncMock()
+    pages = []
+
+    async def new_page():
+        page = MagicMock()
+        page.route = AsyncMock()
+        page.goto = AsyncMock()
+        page.evaluate = AsyncMock()
+        page.close = AsyncMock()
+        pages.append(page)
+        return page
+
+    browser.context.new_page = new_page
+
+    await browser._inject_storage_state(
+        {
+            "cookies": [],
+            "origins": [
+                {"origin": "https://a.example", "localStorage": [{"name": "k", "value": "1"}]},
+                {"origin": "https://b.example", "localStorage": [{"name": "k", "value": "2"}]},
+                {"origin": "https://c.example", "localStorage": []},
+            ],
+        }
+    )
+
+    assert len(pages) == 2
+    assert sorted(p.goto.call_args[0][0] for p in pages) == [
+        "https://a.example",
+        "https://b.example",
+    ]
+    for page in pages:
+        page.route.assert_awaited_once()
+        page.evaluate.assert_awaited_once()
+        page.close.assert_awaited_once()
+    browser.page.goto.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_async_inject_storage_state_reads_file_off_loop(tmp_path):
+    """Test a storage state file is loaded in a worker thread"""
+    import asyncio
+    import json
+    from unittest.mock import AsyncMock, MagicMock, patch
+
+    state_file = tmp_path / "state.json"
+    state_file.write_text(json.dumps({"cookies": [], "origins": []}))
+    browser = AsyncSentienceBrowser()
+    browser.context = MagicMock()
+    browser.context.add_cookies = AsyncMock()
+
+    with patch("sentience.browser.asyncio.to_thread", wraps=asyncio.to_thread) as mock_to_thread:
+        await browser._inject_storage_state(state_file)
+
+    mock_to_thread.assert_called_once()
+    assert mock_to_thread.call_args[0][1] == state_file
+    browser.context.add_cookies.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_async_http_client_reused_and_closed_on_close():
+    """Test gateway HTTP client is created once per browser and closed with it"""
+    from unittest.mock import AsyncMock, patch
+
+    browser = AsyncSentienceBrowser()
+    client = browser._get_http_client()
+    assert browser._get_http_client() is client
+
+    with (
+        patch.object(client, "aclose", new=AsyncMock()) as mock_aclose,
+        patch("sentience.browser.asyncio.sleep", new=AsyncMock()),
+    ):
+        await browser.close()
+
+    mock_aclose.assert_awaited_once()
+    assert browser._http_client is None
+
+
+@pytest.mark.asyncio
+async def test_async_close_removes_private_extension_dir_off_loop(tmp_path):
+    """Test close() deletes a private extension copy via a worker thread, never the shared cache"""
+    import asyncio
+    from unittest.mock import AsyncMock, patch
+
+    private_dir = tmp_path / "sentience-ext-private"
+    private_dir.mkdir()
+    browser = AsyncSentienceBrowser()
+    browser._extension_path = str(private_dir)
+
+    with patch("sentience.browser.asyncio.sleep", new=AsyncMock()):
+        with patch(
+            "sentience.browser.asyncio.to_thread", wraps=asyncio.to_thread
+        ) as mock_to_thread:
+            await browser.close()
+
+    assert not private_dir.exists()
+    mock_to_thread.assert_called_once()
+
+    shared_dir = tmp_path / "ext-shared"
+    shared_dir.mkdir()
+    browser = AsyncSentienceBrowser()
+    browser._extension_path = str(shared_dir)
+    browser._extension_path_is_shared = True
+
+    with patch("sentience.browser.asyncio.sleep", new=AsyncMock()):
+        await browser.close()
+
+    assert shared_dir.exists()
+
+
+@pytest.mark.asyncio
+async def test_async_press_eager_return_snapshots_in_background():
+    """Test eager_return hands back the post-action snapshot as a pending future"""
+    import asyncio
+    from unittest.mock import AsyncMock, MagicMock, patch
+
+    from sentience.models import Snapshot
+
+    browser = AsyncSentienceBrowser()
+    browser.page = MagicMock()
+    browser.page.url = "https://example.com/"
+    browser.page.evaluate = AsyncMock(return_value=None)
+    browser.page.keyboard.press = AsyncMock()
+    browser.page.wait_for_timeout = AsyncMock()
+    snap = Snapshot(status="success", url="https://example.com/", elements=[])
+    release = asyncio.Event()
+
+    async def slow_snapshot(_browser):
+        await release.wait()
+        return snap
+
+    with patch("sentience.actions.snapshot_async", new=slow_snapshot):
+        result = await press_async(browser, "Enter", take_snapshot=True, eager_return=True)
+
+        assert result.snapshot_after is None
+        assert not result.snapshot_after_future.done()
+        release.set()
+        assert await result.snapshot_after_future is snap
+
+    assert "snapshot_after_future" not in result.model_dump()
+
+
+@pytest.mark.asyncio
+async def test_browser_pool_shares_one_browser_across_tabs():
+    """Test the pool launches one browser and hands out one tab per acquire"""
+    import asyncio
+    from unittest.mock import AsyncMock, MagicMock, patch
+
+    starts = []
+
+    async def fake_start(self):
+        starts.append(self)
+        self.context = MagicMock()
+        self.context.new_page = AsyncMock(
+            side_effect=lambda: MagicMock(close=AsyncMock(), is_closed=lambda: False)
+        )
+
+    with (
+        patch.object(AsyncSentienceBrowser, "start", new=fake_start),
+        patch("sentience.browser.STEALTH_AVAILABLE", False),
+    ):
+        pool = AsyncSentienceBrowserPool(max_pages=1, headless=True)
+        await asyncio.gather(pool.start(), pool.start())
+        first = await pool.acquire()
+        assert len(starts) == 1
+        assert first.context is starts[0].context
+
+        # max_pages=1: the next acquire waits until the first tab is released
+        pending = asyncio.ensure_future(pool.acquire())
+        await asyncio.sleep(0)
+        assert not pending.done()
+
+        page = first.page
+        await pool.release(first)
+        page.close.assert_awaited_once()
+        second = await asyncio.wait_for(pending, 1)
+        assert second.page is not page
+        assert len(starts) == 1
+        await pool.release(second)
+
+
+@pytest.mark.asyncio
+async def test_browser_pool_view_close_only_releases_its_tab():
+    """Test closing a pooled view returns the tab instead of closing the shared browser"""
+    import asyncio
+    from unittest.mock import AsyncMock, MagicMock, patch
+
+    async def fake_start(self):
+        self.context = MagicMock()
+        self.context.new_page = AsyncMock(
+            side_effect=lambda: MagicMock(close=AsyncMock(), is_closed=lambda: False)
+        )
+
+    with (
+        patch.object(AsyncSentienceBrowser, "start", new=fake_start),
+        patch("sentience.browser.STEALTH_AVAILABLE", False),
+    ):
+        pool = AsyncSentienceBrowserPool(max_pages=1, headless=True)
+        view = await pool.acquire()
+        page = view.page
+
+        async with view:
+            assert view.page is page
+        await view.close()
+
+        page.close.assert_awaited_once()
+        pool._browser.context.close.assert_not_called()
+        # The slot was returned, so the next acquire doesn't block
+        await asyncio.wait_for(pool.acquire(), 1)
@@ -847,6 +847,22 @@ class TestCachedSnapshot:
 
         assert cache._is_stale() is False
 
+    @pytest.mark.asyncio
+    async def test_refreshes_after_navigation(self, mock_backend: MagicMock) -> None:
+        """Test a fresh cache is dropped once the page URL changes."""
+        cache = CachedSnapshot(mock_backend, max_age_ms=2000)
+        cache._cached = MagicMock()
+        cache._cached_at = time.time()
+        cache._cached_url = "https://example.com/a"
+        mock_backend.get_url = AsyncMock(return_value="https://example.com/a")
+
+        # Same URL: served from cache
+        assert await cache._url_changed() is False
+        # A navigation right after the last check is detected immediately
+        mock_backend.get_url.return_value = "https://example.com/b"
+        assert await cache._url_changed() is True
+        assert mock_backend.get_url.await_count == 2
+
 
 class TestCoordinateResolution:
     """Test coordinate resolution in actions."""
@@ -895,6 +911,59 @@ class TestCoordinateResolution:
         assert y == 400
 
 
+class TestWaitForExtension:
+    """Tests for the backend-agnostic extension wait."""
+
+    @pytest.mark.asyncio
+    async def test_single_in_page_wait(self) -> None:
+        """Test the in-page poll resolves the wait in one eval."""
+        from sentience.backends.snapshot import _wait_for_extension
+
+        backend = MagicMock()
+        backend.eval = AsyncMock(return_value=True)
+
+        await _wait_for_extension(backend, timeout_ms=1000)
+
+        assert backend.eval.await_count == 1
+        assert "new Promise" in backend.eval.await_args.args[0]
+
+    @pytest.mark.asyncio
+    async def test_falls_back_to_polling(self) -> None:
+        """Test polling takes over when the in-page wait is interrupted."""
+        from sentience.backends.snapshot import _wait_for_extension
+
+        backend = MagicMock()
+        backend.eval = AsyncMock(side_effect=[RuntimeError("context destroyed"), False, True])
+
+        await _wait_for_extension(backend, timeout_ms=1000)
+
+        assert backend.eval.await_count == 3
+
+
+class TestBackendSnapshot:
+    """Tests for backend-agnostic snapshot()."""
+
+    @pytest.mark.asyncio
+    async def test_overlay_rendered_in_snapshot_eval(self) -> None:
+        """Test show_overlay doesn't cost a second eval round-trip."""
+        from sentience.backends.snapshot import snapshot as backend_snapshot
+        from sentience.models import SnapshotOptions
+
+        backend = MagicMock()
+        backend.eval = AsyncMock(
+            side_effect=[
+                True,  # extension ready
+                {"status": "success", "url": "https://example.com", "elements": []},
+            ]
+        )
+
+        snap = await backend_snapshot(backend, SnapshotOptions(show_overlay=True))
+
+        assert snap.url == "https://example.com"
+        assert backend.eval.await_count == 2
+        assert "showOverlay" in backend.eval.await_args.args[0]
+
+
 class TestBackendExceptions:
     """Tests for custom backend exceptions."""
 
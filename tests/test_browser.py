@@ -168,3 +168,439 @@ def test_from_page_with_api_key():
         finally:
             context.close()
             browser_instance.close()
+
+
+def test_inject_storage_state_cookies_drop_unset_fields():
+    """Test cookies are passed to add_cookies in one call without unset optional fields"""
+    from unittest.mock import MagicMock
+
+    browser = SentienceBrowser()
+    browser.context = MagicMock()
+    browser.page = MagicMock()
+
+    browser._inject_storage_state(
+        {
+            "cookies": [
+                {"name": "a", "value": "1", "domain": ".example.com"},
+                {
+                    "name": "b",
+                    "value": "2",
+                    "domain": ".example.com",
+                    "expires": 1700000000.0,
+                    "httpOnly": True,
+                    "secure": True,
+                    "sameSite": "Strict",
+                },
+            ],
+            "origins": [],
+        }
+    )
+
+    browser.context.add_cookies.assert_called_once()
+    cookies = browser.context.add_cookies.call_args[0][0]
+    assert cookies[0] == {
+        "name": "a",
+        "value": "1",
+        "domain": ".example.com",
+        "path": "/",
+        "sameSite": "Lax",
+    }
+    assert cookies[1]["expires"] == 1700000000.0
+    assert cookies[1]["httpOnly"] is True
+    assert cookies[1]["sameSite"] == "Strict"
+    browser.page.goto.assert_not_called()
+
+
+def test_inject_storage_state_local_storage_single_json_payload(caplog):
+    """Test localStorage is passed as one JSON string and rejected keys are logged"""
+    import json
+    import logging
+    from unittest.mock import MagicMock
+
+    browser = SentienceBrowser()
+    browser.context = MagicMock()
+    browser.page = MagicMock()
+    browser.page.evaluate.return_value = ["big"]
+
+    with caplog.at_level(logging.WARNING, logger="sentience.browser"):
+        browser._inject_storage_state(
+            {
+                "cookies": [],
+                "origins": [
+                    {
+                        "origin": "https://example.com",
+                        "localStorage": [
+                            {"name": "token", "value": "abc"},
+                            {"name": "big", "value": "x"},
+                        ],
+                    }
+                ],
+            }
+        )
+
+    browser.page.goto.assert_called_once()
+    # The origin is served a blank document for the duration of the injection only
+    route_args = browser.page.route.call_args[0]
+    assert browser.page.unroute.call_args[0] == route_args
+    payload = browser.page.evaluate.call_args[0][1]
+    assert isinstance(payload, str)
+    assert json.loads(payload) == {"token": "abc", "big": "x"}
+    assert "rejected 1 key(s)" in caplog.text
+
+
+def test_http_session_reused_and_closed_on_close():
+    """Test gateway HTTP session is created once per browser and closed with it"""
+    from unittest.mock import patch
+
+    browser = SentienceBrowser()
+    session = browser._get_http_session()
+    assert browser._get_http_session() is session
+
+    with patch.object(session, "close") as mock_close:
+        browser.close()
+
+    mock_close.assert_called_once()
+    assert browser._http_session is None
+
+
+def test_goto_failure_reports_probe_diagnostics_without_extra_evaluate():
+    """Test goto() reuses the readiness probe's diagnostics instead of evaluating again"""
+    from unittest.mock import MagicMock
+
+    from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
+
+    from sentience.browser import _EXTENSION_READY_JS
+
+    browser = SentienceBrowser()
+    browser.page = MagicMock()
+    browser.page.wait_for_function.side_effect = PlaywrightTimeoutError("Timeout exceeded")
+    browser.page.evaluate.return_value = {
+        "ready": False,
+        "reason": "window.sentience undefined",
+        "diag": {"sentience_defined": False, "extension_id": "not set"},
+    }
+    browser._wait_for_extension = lambda: SentienceBrowser._wait_for_extension(
+        browser, timeout_sec=0.01
+    )
+
+    with pytest.warns(UserWarning), pytest.raises(RuntimeError) as exc_info:
+        browser.goto("https://example.com")
+
+    assert "'sentience_defined': False" in str(exc_info.value)
+    assert all(c.args == (_EXTENSION_READY_JS,) for c in browser.page.evaluate.call_args_list)
+
+
+def test_wait_for_extension_waits_in_page():
+    """Test readiness is awaited with one in-page wait_for_function, not evaluate polling"""
+    from unittest.mock import MagicMock
+
+    from sentience.browser import _EXTENSION_READY_PREDICATE_JS
+
+    browser = SentienceBrowser()
+    browser.page = MagicMock()
+
+    assert browser._wait_for_extension(timeout_sec=2.0) is True
+
+    browser.page.wait_for_function.assert_called_once()
+    assert browser.page.wait_for_function.call_args.args == (_EXTENSION_READY_PREDICATE_JS,)
+    assert 0 < browser.page.wait_for_function.call_args.kwargs["timeout"] <= 2000
+    browser.page.evaluate.assert_not_called()
+
+
+def test_wait_for_extension_retries_after_navigation():
+    """Test a destroyed execution context re-installs the predicate instead of failing"""
+    from unittest.mock import MagicMock
+
+    browser = SentienceBrowser()
+    browser.page = MagicMock()
+    browser.page.wait_for_function.side_effect = [
+        Exception("Execution context was destroyed, most likely because of a navigation"),
+        None,
+    ]
+
+    assert browser._wait_for_extension(timeout_sec=2.0) is True
+    assert browser.page.wait_for_function.call_count == 2
+
+
+def test_stealth_is_imported_on_first_use(monkeypatch):
+    """Test playwright_stealth is only imported when stealth is applied"""
+    import sys
+    import types
+    from unittest.mock import MagicMock
+
+    from sentience.browser import stealth_sync
+
+    fake = types.ModuleType("playwright_stealth")
+    fake.stealth_sync = MagicMock()
+    monkeypatch.setitem(sys.modules, "playwright_stealth", fake)
+    page = MagicMock()
+
+    stealth_sync(page)
+
+    fake.stealth_sync.assert_called_once_with(page)
+
+
+def test_stealth_applied_once_per_page(monkeypatch):
+    """Test wrapping the same page again does not re-run playwright_stealth"""
+    import sys
+    import types
+    from unittest.mock import MagicMock
+
+    from sentience.browser import SentienceBrowser
+
+    fake = types.ModuleType("playwright_stealth")
+    fake.stealth_sync = MagicMock()
+    monkeypatch.setitem(sys.modules, "playwright_stealth", fake)
+    monkeypatch.setattr("sentience.browser.STEALTH_AVAILABLE", True)
+    page, other_page = MagicMock(), MagicMock()
+
+    SentienceBrowser.from_page(page)
+    SentienceBrowser.from_page(page)
+    SentienceBrowser.from_page(other_page)
+
+    assert [c.args[0] for c in fake.stealth_sync.call_args_list] == [page, other_page]
+
+
+def test_from_page_returns_without_fixed_delay():
+    """Test from_page() leaves readiness to goto()/snapshot() instead of sleeping"""
+    from unittest.mock import MagicMock, patch
+
+    with patch("sentience.browser.time.sleep") as mock_sleep:
+        browser = SentienceBrowser.from_page(MagicMock())
+
+    mock_sleep.assert_not_called()
+    browser.page.wait_for_function.assert_not_called()
+
+    assert browser.wait_for_extension_ready(timeout_sec=1.0) is True
+    browser.page.wait_for_function.assert_called_once()
+
+
+def test_close_removes_private_extension_dir_in_background(tmp_path):
+    """Test close() hands a private extension copy to a worker thread, never the shared cache"""
+    import threading
+    from unittest.mock import patch
+
+    private_dir = tmp_path / "sentience-ext-private"
+    private_dir.mkdir()
+    browser = SentienceBrowser()
+    browser._extension_path = str(private_dir)
+
+    with patch("sentience.browser.threading.Thread", wraps=threading.Thread) as mock_thread:
+        browser.close()
+    for thread in threading.enumerate():
+        if thread.name == "sentience-ext-rmtree":
+            thread.join()
+
+    mock_thread.assert_called_once()
+    assert not private_dir.exists()
+
+    shared_dir = tmp_path / "ext-shared"
+    shared_dir.mkdir()
+    browser = SentienceBrowser()
+    browser._extension_path = str(shared_dir)
+    browser._extension_path_is_shared = True
+
+    browser.close()
+
+    assert shared_dir.exists()
+
+
+def test_prepare_extension_dir_prefers_shared_cache(monkeypatch, tmp_path):
+    """Test the shared cache copy is used, with a private temp copy when caching is off"""
+    from unittest.mock import patch
+
+    from sentience.browser import _prepare_extension_dir
+
+    monkeypatch.delenv("SENTIENCE_EXT_CACHE", raising=False)
+    with (
+        patch("sentience.browser.get_cached_extension_dir", return_value=tmp_path),
+        patch("sentience.browser.shutil.copytree") as mock_copytree,
+    ):
+        path, is_shared = _prepare_extension_dir()
+
+    assert (path, is_shared) == (str(tmp_path), True)
+    mock_copytree.assert_not_called()
+
+    monkeypatch.setenv("SENTIENCE_EXT_CACHE", "0")
+    with (
+        patch("sentience.browser.shutil.copytree") as mock_copytree,
+        patch("sentience.browser.tempfile.mkdtemp", return_value="/tmp/sentience-ext-1-x"),
+    ):
+        path, is_shared = _prepare_extension_dir()
+
+    assert (path, is_shared) == ("/tmp/sentience-ext-1-x", False)
+    mock_copytree.assert_called_once()
+
+
+def test_share_playwright_reuses_one_driver():
+    """Test share_playwright=True starts one driver for several browsers and stops it once"""
+    from unittest.mock import MagicMock, patch
+
+    from sentience.browser import _acquire_shared_playwright, _release_shared_playwright
+
+    with patch("sentience.browser.sync_playwright") as mock_sync_playwright:
+        first = _acquire_shared_playwright()
+        second = _acquire_shared_playwright()
+
+        assert first is second
+        mock_sync_playwright.return_value.start.assert_called_once()
+        assert _release_shared_playwright() is False
+        assert _release_shared_playwright() is True
+
+        # The next acquire after the last release starts a fresh driver
+        _acquire_shared_playwright()
+        assert mock_sync_playwright.return_value.start.call_count == 2
+        _release_shared_playwright()
+
+    # close() leaves the driver running while other browsers still hold it
+    browser = SentienceBrowser(share_playwright=True)
+    driver = browser.playwright = MagicMock()
+    with patch("sentience.browser._release_shared_playwright", return_value=False):
+        browser.close()
+    driver.stop.assert_not_called()
+    assert browser.playwright is None
+
+
+def test_failed_start_releases_shared_driver():
+    """Test a start() that fails to launch drops its reference to the shared driver"""
+    from unittest.mock import patch
+
+    from sentience.browser import _release_shared_playwright, _shared_sync_playwright
+
+    with (
+        patch("sentience.browser.sync_playwright") as mock_sync_playwright,
+        patch("sentience.browser._prepare_extension_dir", return_value=("/tmp/ext", True)),
+    ):
+        driver = mock_sync_playwright.return_value.start.return_value
+        driver.chromium.launch_persistent_context.side_effect = RuntimeError("launch failed")
+
+        browser = SentienceBrowser(share_playwright=True)
+        with pytest.raises(RuntimeError, match="launch failed"):
+            browser.start()
+
+    driver.stop.assert_called_once()
+    assert browser.playwright is None
+    assert _shared_sync_playwright.refs == 0
+    # A stray release with nothing held is a no-op
+    assert _release_shared_playwright() is False
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_load_storage_state_file_with_and_without_orjson(tmp_path, use_orjson):
+    """Test storage state files load the same with and without orjson"""
+    import json
+    from unittest.mock import patch
+
+    import sentience.browser as browser_module
+
+    if use_orjson and not browser_module.ORJSON_AVAILABLE:
+        pytest.skip("orjson not installed")
+
+    state_file = tmp_path / "state.json"
+    state_file.write_text(
+        json.dumps(
+            {
+                "cookies": [{"name": "sid", "value": "café", "domain": ".example.com"}],
+                "origins": [
+                    {"origin": "https://example.com", "localStorage": [{"name": "k", "value": "v"}]}
+                ],
+            }
+        ),
+        encoding="utf-8",
+    )
+
+    with patch.object(browser_module, "ORJSON_AVAILABLE", use_orjson):
+        state = browser_module._load_storage_state(state_file)
+        payload = browser_module._local_storage_json(state.origins[0])
+
+    assert state.cookies[0].value == "café"
+    assert json.loads(payload) == {"k": "v"}
+
+
+@pytest.mark.parametrize(
+    "system,euid,expected,unexpected",
+    [
+        ("Linux", 0, "--no-sandbox", "--disable-gpu"),
+        ("Linux", 1000, "--headless=new", "--no-sandbox"),
+        ("Darwin", 0, "--disable-gpu", "--no-sandbox"),
+    ],
+)
+def test_chrome_args_per_platform(system, euid, expected, unexpected):
+    """Test launch flags load the extension and add platform-specific flags"""
+    from unittest.mock import patch
+
+    from sentience.browser import _chrome_args
+
+    with (
+        patch("sentience.browser.platform.system", return_value=system),
+        patch("sentience.browser.os.geteuid", return_value=euid, create=True),
+    ):
+        args = _chrome_args("/ext", headless=True)
+
+    assert args[:2] == ["--disable-extensions-except=/ext", "--load-extension=/ext"]
+    assert expected in args
+    assert unexpected not in args
+    assert "--disable-infobars" not in args
+    assert args[-1] == "--headless=new"
+
+
+def test_browser_pool_reuses_one_browser():
+    """Test SentienceBrowserPool launches once and hands out one tab per session"""
+    from unittest.mock import MagicMock, patch
+
+    from sentience.browser import SentienceBrowser, SentienceBrowserPool
+
+    starts = []
+
+    def fake_start(self):
+        starts.append(self)
+        self.context = MagicMock()
+        self.context.new_page.side_effect = lambda: MagicMock(is_closed=lambda: False)
+
+    with (
+        patch.object(SentienceBrowser, "start", new=fake_start),
+        patch.object(SentienceBrowser, "close") as mock_close,
+        patch("sentience.browser.STEALTH_AVAILABLE", False),
+    ):
+        with SentienceBrowserPool(headless=True) as pool:
+            with pool.page() as first:
+                first_page = first.page
+                assert first.context is starts[0].context
+            with pool.page() as second:
+                assert second.page is not first_page
+
+        assert len(starts) == 1
+        first_page.close.assert_called_once()
+        assert first.page is None
+        mock_close.assert_called_once()
+
+
+def test_browser_pool_view_close_only_releases_its_tab():
+    """Test closing a pooled view returns the tab instead of closing the shared browser"""
+    from unittest.mock import MagicMock, patch
+
+    from sentience.browser import SentienceBrowser, SentienceBrowserPool
+
+    def fake_start(self):
+        self.context = MagicMock()
+        self.context.new_page.side_effect = lambda: MagicMock(is_closed=lambda: False)
+
+    with (
+        patch.object(SentienceBrowser, "start", new=fake_start),
+        patch("sentience.browser.STEALTH_AVAILABLE", False),
+    ):
+        pool = SentienceBrowserPool(headless=True)
+        view = pool.acquire()
+        page = view.page
+
+        # Views reuse the shared browser's keep-alive HTTP session
+        assert view._get_http_session() is pool._browser._get_http_session()
+
+        with view:
+            assert view.page is page
+        view.close()
+
+        page.close.assert_called_once()
+        assert view.page is None
+        pool._browser.context.close.assert_not_called()
+        assert pool._browser._http_session is not None
@@ -0,0 +1,189 @@
+"""Tests for shared extension loading helpers"""
+
+import os
+import time
+from unittest.mock import patch
+
+import pytest
+
+from sentience._extension_loader import cleanup_orphaned_extension_dirs, get_cached_extension_dir
+
+
+@pytest.fixture
+def extension_source(tmp_path):
+    """Minimal unpacked extension tree"""
+    source = tmp_path / "extension"
+    (source / "pkg").mkdir(parents=True)
+    (source / "manifest.json").write_text('{"version": "1.0.0"}')
+    (source / "pkg" / "core.wasm").write_bytes(b"\0asm")
+    return source
+
+
+@pytest.fixture
+def cache_home(tmp_path, monkeypatch):
+    """Point the user cache dir at a temp location"""
+    cache = tmp_path / "cache"
+    monkeypatch.setenv("XDG_CACHE_HOME", str(cache))
+    monkeypatch.delenv("SENTIENCE_EXT_CACHE", raising=False)
+    return cache
+
+
+class TestCachedExtensionDir:
+    """Test content-addressed extension cache"""
+
+    def test_copies_bundle_into_cache(self, extension_source, cache_home):
+        """First call copies the bundle under the user cache dir"""
+        cached = get_cached_extension_dir(extension_source)
+
+        assert cached is not None
+        assert cached.parent == cache_home / "sentience"
+        assert cached.name.startswith("ext-")
+        assert (cached / "manifest.json").read_text() == '{"version": "1.0.0"}'
+        assert (cached / "pkg" / "core.wasm").read_bytes() == b"\0asm"
+
+    def test_reuses_cache_without_copying(self, extension_source, cache_home):
+        """Second call returns the same dir without another copytree"""
+        first = get_cached_extension_dir(extension_source)
+
+        with patch("sentience._extension_loader.shutil.copytree") as mock_copytree:
+            second = get_cached_extension_dir(extension_source)
+
+        assert second == first
+        mock_copytree.assert_not_called()
+
+    def test_fingerprint_walks_tree_once_per_process(self, extension_source, cache_home):
+        """Later calls reuse the fingerprint instead of re-walking the extension tree"""
+        first = get_cached_extension_dir(extension_source)
+
+        with patch.object(type(extension_source), "rglob") as mock_rglob:
+            second = get_cached_extension_dir(extension_source)
+
+        assert second == first
+        mock_rglob.assert_not_called()
+
+    def test_rebuilt_extension_gets_new_cache_dir(self, extension_source, cache_home):
+        """Changing the extension tree changes the fingerprint"""
+        from sentience._extension_loader import _extension_fingerprint
+
+        first = get_cached_extension_dir(extension_source)
+        (extension_source / "pkg" / "core.wasm").write_bytes(b"\0asm-rebuilt")
+        _extension_fingerprint.cache_clear()
+
+        second = get_cached_extension_dir(extension_source)
+
+        assert second != first
+        assert (second / "pkg" / "core.wasm").read_bytes() == b"\0asm-rebuilt"
+
+    def test_bundle_is_hardlinked_when_possible(self, extension_source, cache_home):
+        """Files are linked rather than byte-copied on the same filesystem"""
+        cached = get_cached_extension_dir(extension_source)
+
+        source_wasm = (extension_source / "pkg" / "core.wasm").stat()
+        cached_wasm = (cached / "pkg" / "core.wasm").stat()
+        assert cached_wasm.st_ino == source_wasm.st_ino
+
+    def test_link_failure_falls_back_to_copy(self, extension_source, cache_home):
+        """Filesystems without hardlinks still get a full copy"""
+        with patch("sentience._extension_loader.os.link", side_effect=OSError("EXDEV")):
+            cached = get_cached_extension_dir(extension_source)
+
+        assert (cached / "pkg" / "core.wasm").read_bytes() == b"\0asm"
+        assert (cached / "pkg" / "core.wasm").stat().st_ino != (
+            (extension_source / "pkg" / "core.wasm").stat().st_ino
+        )
+
+    def test_concurrent_threads_use_separate_staging_dirs(self, extension_source, cache_home):
+        """Threads of one process copy into their own staging dir"""
+        import shutil
+        import threading
+
+        staging_dirs = []
+        real_copytree = shutil.copytree
+        barrier = threading.Barrier(2)
+
+        def copytree(src, dst, *args, **kwargs):
+            if not args:  # top-level call (shutil recurses with positional args)
+                staging_dirs.append(dst)
+                barrier.wait(timeout=5)
+            return real_copytree(src, dst, *args, **kwargs)
+
+        results = []
+        with patch("sentience._extension_loader.shutil.copytree", side_effect=copytree):
+            threads = [
+                threading.Thread(
+                    target=lambda: results.append(get_cached_extension_dir(extension_source))
+                )
+                for _ in range(2)
+            ]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+
+        assert len(set(staging_dirs)) == 2
+        assert results[0] == results[1]
+        assert (results[0] / "pkg" / "core.wasm").read_bytes() == b"\0asm"
+
+    def test_disabled_via_env(self, extension_source, cache_home, monkeypatch):
+        """SENTIENCE_EXT_CACHE=0 disables the cache"""
+        monkeypatch.setenv("SENTIENCE_EXT_CACHE", "0")
+
+        assert get_cached_extension_dir(extension_source) is None
+        assert not cache_home.exists()
+
+    def test_unwritable_cache_returns_none(self, extension_source, cache_home):
+        """Copy failures fall back to None instead of raising"""
+        with patch("sentience._extension_loader.shutil.copytree", side_effect=OSError("denied")):
+            assert get_cached_extension_dir(extension_source) is None
+
+
+class TestFindExtensionPath:
+    """Test extension path lookup caching"""
+
+    def test_result_is_cached(self):
+        """Repeated lookups don't touch the filesystem again"""
+        from sentience._extension_loader import find_extension_path
+
+        find_extension_path.cache_clear()
+        try:
+            first = find_extension_path()
+            with patch("sentience._extension_loader.Path.exists") as mock_exists:
+                assert find_extension_path() == first
+            mock_exists.assert_not_called()
+        finally:
+            find_extension_path.cache_clear()
+
+
+class TestOrphanCleanup:
+    """Test cleanup of temp extension copies leaked by dead processes"""
+
+    @pytest.fixture
+    def tmpdir_root(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(
+            "sentience._extension_loader.tempfile.gettempdir", lambda: str(tmp_path)
+        )
+        return tmp_path
+
+    @staticmethod
+    def _make(root, name, age_sec):
+        path = root / name
+        (path / "pkg").mkdir(parents=True)
+        old = time.time() - age_sec
+        os.utime(path, (old, old))
+        return path
+
+    @pytest.mark.skipif(os.name == "nt", reason="POSIX-only cleanup")
+    def test_removes_only_old_dirs_of_dead_processes(self, tmpdir_root):
+        """Recent, live-owner and legacy (pid-less) dirs are left alone"""
+        dead_pid = 2**22 + 100  # above Linux pid_max, never a live pid
+        orphan = self._make(tmpdir_root, f"sentience-ext-{dead_pid}-abc", 7200)
+        recent = self._make(tmpdir_root, f"sentience-ext-{dead_pid}-def", 10)
+        live = self._make(tmpdir_root, f"sentience-ext-{os.getppid()}-ghi", 7200)
+        legacy = self._make(tmpdir_root, "sentience-ext-k3j9x2", 7200)
+
+        assert cleanup_orphaned_extension_dirs(max_age_sec=3600) == 1
+
+        assert not orphan.exists()
+        assert recent.exists()
+        assert live.exists()
+        assert legacy.exists()
@@ -196,3 +196,277 @@ def test_element_ml_fields_optional():
     assert element_partial.heuristic_index is None
     assert element_partial.ml_probability == 0.87
     assert element_partial.ml_score is None
+
+
+def test_post_snapshot_to_gateway_sends_encoded_body():
+    """Test gateway POST sends the pre-encoded bytes that were size-checked"""
+    import json
+    from unittest.mock import MagicMock, patch
+
+    from sentience.snapshot import _post_snapshot_to_gateway_sync
+
+    payload = {"raw_elements": [{"text": "café"}], "url": "https://example.com"}
+    response = MagicMock()
+    response.content = b'{"status": "success"}'
+    response.json.return_value = {"status": "success"}
+
+    with patch("sentience.snapshot.requests.post", return_value=response) as mock_post:
+        result = _post_snapshot_to_gateway_sync(payload, "sk_test", "https://api.test")
+
+    assert result == {"status": "success"}
+    body = mock_post.call_args.kwargs["data"]
+    assert isinstance(body, bytes)
+    assert json.loads(body) == payload
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_gateway_json_codec_roundtrip(use_orjson):
+    """Test payload encoding/response decoding with and without orjson"""
+    import importlib
+    import json
+    from unittest.mock import MagicMock, patch
+
+    # sentience.snapshot is shadowed by the snapshot() function on the package
+    snapshot_module = importlib.import_module("sentience.snapshot")
+
+    if use_orjson and not snapshot_module.ORJSON_AVAILABLE:
+        pytest.skip("orjson not installed")
+
+    payload = {"raw_elements": [{"id": 1, "text": "café"}], "goal": None}
+    response = MagicMock()
+    response.content = json.dumps(payload).encode("utf-8")
+    response.json.return_value = payload
+
+    with patch.object(snapshot_module, "ORJSON_AVAILABLE", use_orjson):
+        body = snapshot_module._encode_payload(payload)
+        decoded = snapshot_module._decode_response(response)
+
+    assert isinstance(body, bytes)
+    assert json.loads(body) == payload
+    assert decoded == payload
+
+
+def test_post_snapshot_to_gateway_rejects_oversized_payload():
+    """Test payloads over MAX_PAYLOAD_BYTES fail before any request is made"""
+    from unittest.mock import patch
+
+    from sentience.snapshot import MAX_PAYLOAD_BYTES, _post_snapshot_to_gateway_sync
+
+    payload = {"raw_elements": [], "blob": "x" * MAX_PAYLOAD_BYTES}
+
+    with patch("sentience.snapshot.requests.post") as mock_post:
+        with pytest.raises(ValueError, match="exceeds server limit"):
+            _post_snapshot_to_gateway_sync(payload, "sk_test")
+
+    mock_post.assert_not_called()
+
+
+def test_post_snapshot_to_gateway_uses_given_session():
+    """Test gateway POST goes through a provided keep-alive session"""
+    from unittest.mock import MagicMock, patch
+
+    from sentience.snapshot import _post_snapshot_to_gateway_sync
+
+    session = MagicMock()
+    session.post.return_value.content = b'{"status": "success"}'
+    session.post.return_value.json.return_value = {"status": "success"}
+
+    with patch("sentience.snapshot.requests.post") as mock_post:
+        _post_snapshot_to_gateway_sync({"raw_elements": []}, "sk_test", session=session)
+
+    session.post.assert_called_once()
+    mock_post.assert_not_called()
+
+
+def _browser_with_mock_page(url="https://example.com/"):
+    import json
+    from unittest.mock import MagicMock
+
+    browser = SentienceBrowser()
+    browser.page = MagicMock()
+    browser.page.url = url
+    browser.page.evaluate.return_value = json.dumps(
+        {"status": "success", "url": url, "elements": []}
+    )
+    return browser
+
+
+def test_snapshot_skips_extension_wait_when_ready_on_url():
+    """Test readiness wait is skipped once confirmed on the current URL"""
+    from unittest.mock import patch
+
+    browser = _browser_with_mock_page()
+    browser._extension_ready_for_url = "https://example.com/"
+
+    with patch("sentience.snapshot.BrowserEvaluator.wait_for_extension") as mock_wait:
+        snapshot(browser)
+
+    mock_wait.assert_not_called()
+
+
+def test_snapshot_waits_for_extension_on_new_url():
+    """Test readiness wait runs on a new URL and is then remembered"""
+    from unittest.mock import patch
+
+    browser = _browser_with_mock_page()
+    browser._extension_ready_for_url = "https://example.com/previous"
+
+    with patch("sentience.snapshot.BrowserEvaluator.wait_for_extension") as mock_wait:
+        snapshot(browser)
+        snapshot(browser)
+
+    mock_wait.assert_called_once()
+    assert browser._extension_ready_for_url == "https://example.com/"
+
+
+def test_snapshot_falls_back_to_wait_after_in_place_reload():
+    """Test a failed fast-path call waits for the extension and retries"""
+    from unittest.mock import patch
+
+    browser = _browser_with_mock_page()
+    browser._extension_ready_for_url = "https://example.com/"
+    ok_result = browser.page.evaluate.return_value
+    browser.page.evaluate.side_effect = [Exception("window.sentience is undefined"), ok_result]
+
+    with patch("sentience.snapshot.BrowserEvaluator.wait_for_extension") as mock_wait:
+        snap = snapshot(browser)
+
+    mock_wait.assert_called_once()
+    assert snap.status == "success"
+    assert browser.page.evaluate.call_count == 2
+
+
+def test_snapshot_fast_path_reraises_unrelated_errors():
+    """Test a fast-path failure that isn't extension readiness propagates without a retry"""
+    from unittest.mock import patch
+
+    browser = _browser_with_mock_page()
+    browser._extension_ready_for_url = "https://example.com/"
+    browser.page.evaluate.side_effect = ValueError("bad snapshot options")
+
+    with patch("sentience.snapshot.BrowserEvaluator.wait_for_extension") as mock_wait:
+        with pytest.raises(ValueError, match="bad snapshot options"):
+            snapshot(browser)
+
+    mock_wait.assert_not_called()
+    assert browser.page.evaluate.call_count == 1
+
+
+def test_api_snapshot_serializes_screenshot_config():
+    """Test API-mode snapshot sends ScreenshotConfig to the extension as a plain dict"""
+    from unittest.mock import patch
+
+    from sentience.models import ScreenshotConfig, SnapshotOptions
+
+    browser = _browser_with_mock_page()
+    options = SnapshotOptions(
+        screenshot=ScreenshotConfig(format="jpeg", quality=80), sentience_api_key="sk_test"
+    )
+
+    with (
+        patch("sentience.snapshot.BrowserEvaluator.wait_for_extension"),
+        patch(
+            "sentience.snapshot._post_snapshot_to_gateway_sync",
+            return_value={"status": "success", "elements": []},
+        ) as mock_post,
+    ):
+        snapshot(browser, options)
+
+    mock_post.assert_called_once()
+    ext_options = browser.page.evaluate.call_args.args[1]
+    assert ext_options == {"screenshot": {"format": "jpeg", "quality": 80}}
+
+
+def test_snapshot_not_cached_when_invalidated_while_running():
+    """Test a snapshot that an action invalidated mid-flight doesn't overwrite the cache"""
+    from unittest.mock import patch
+
+    from sentience.actions import _invalidate_last_snapshot
+
+    browser = _browser_with_mock_page()
+    result = browser.page.evaluate.return_value
+
+    def evaluate_racing_an_action(*args):
+        _invalidate_last_snapshot(browser)
+        return result
+
+    with patch("sentience.snapshot.BrowserEvaluator.wait_for_extension"):
+        browser.page.evaluate.side_effect = evaluate_racing_an_action
+        snapshot(browser)
+        assert browser._last_snapshot is None
+
+        browser.page.evaluate.side_effect = None
+        snap = snapshot(browser)
+
+    assert browser._last_snapshot is snap
+    assert browser._last_snapshot_url == "https://example.com/"
+
+
+def test_snapshot_by_id_index():
+    """Test Snapshot.by_id lookup, first-wins on duplicates, and rebuild on replace"""
+    from sentience.models import BBox, Element, Snapshot, VisualCues
+
+    def el(id_, text):
+        return Element(
+            id=id_,
+            role="button",
+            text=text,
+            importance=1,
+            bbox=BBox(x=0, y=0, width=1, height=1),
+            visual_cues=VisualCues(is_primary=False, is_clickable=True),
+        )
+
+    snap = Snapshot(
+        status="success", url="https://example.com", elements=[el(1, "a"), el(2, "b"), el(1, "c")]
+    )
+
+    assert snap.by_id[2].text == "b"
+    assert snap.by_id[1].text == "a"
+    assert snap.by_id.get(99) is None
+    assert snap.by_id is snap.by_id
+    assert "_by_id_cache" not in snap.model_dump()
+
+    copy = snap.model_copy(update={"elements": [el(3, "d")]})
+    assert list(copy.by_id) == [3]
+
+
+def test_snapshot_result_crosses_cdp_as_json_string():
+    """Test the extension result is JSON-encoded in the page and parsed in Python"""
+    from unittest.mock import patch
+
+    browser = _browser_with_mock_page()
+
+    with patch("sentience.snapshot.BrowserEvaluator.wait_for_extension"):
+        snap = snapshot(browser)
+
+    script = browser.page.evaluate.call_args[0][0]
+    assert "JSON.stringify" in script
+    assert snap.url == "https://example.com/"
+
+
+def test_default_options_send_no_extension_args():
+    """Test snapshot() with default options passes null instead of an options dict"""
+    from unittest.mock import patch
+
+    browser = _browser_with_mock_page()
+
+    with patch("sentience.snapshot.BrowserEvaluator.wait_for_extension"):
+        snapshot(browser)
+        assert browser.page.evaluate.call_args[0][1] is None
+
+        snapshot(browser, SnapshotOptions(limit=100))
+        assert browser.page.evaluate.call_args[0][1] == {"limit": 100}
+
+
+def test_save_trace_logs_path_instead_of_printing(tmp_path, caplog, capsys):
+    """Test the trace file location is reported through the module logger"""
+    import logging
+
+    from sentience.snapshot import _save_trace_to_file
+
+    trace_path = str(tmp_path / "trace.json")
+    with caplog.at_level(logging.INFO, logger="sentience.snapshot"):
+        _save_trace_to_file([{"id": 1}], trace_path)
+
+    assert f"Trace saved to: {trace_path}" in caplog.text
+    assert capsys.readouterr().out == ""
@@ -217,3 +217,14 @@ def test_complex_scenario():
 
     el5 = next(el for el in result if el.id == 5)
     assert el5.diff_status == "ADDED"
+
+
+def test_duplicate_ids_compare_against_last_element():
+    """With duplicate ids in a snapshot, the last element with that id is the one compared."""
+    previous = create_snapshot([create_element(1, text="First"), create_element(1, text="Last")])
+    current = create_snapshot([create_element(1, text="Last")])
+
+    result = SnapshotDiff.compute_diff_status(current, previous)
+
+    assert len(result) == 1
+    assert result[0].diff_status is None